@@ -0,0 +1,175 @@
+"""
+This module defines the clock of a flow, which owns the periodic updates of its nodes.
+
+Instead of running their own threads or timers, periodic nodes register an interval
+with :code:`Flow.clock` in :code:`Node.place_event()` and unregister in
+:code:`Node.remove_event()`. On every tick, the clock updates all nodes which are due
+in one combined flow execution (see :code:`Flow.update_many()`), so the periodic
+updates never race with each other. The clock either runs in its own thread
+(:code:`Clock.start()`), or is driven by the application calling :code:`Clock.tick()`,
+e.g. from its event loop. The clock also sets the values which *latest* coalescing
+policies hold back once their interval ends (see :code:`Flow.coalesce_output()`).
+While the dispatcher thread of :code:`Flow.triggers` is running, the due nodes and
+output values are enqueued there instead of being set by the clock.
+"""
+# prevent cyclic imports
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .Flow import Flow
+    from .Node import Node
+    from .NodePort import NodeOutput
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class ClockStats:
+    """
+    Timing statistics of a clock. The *jitter* of an update is the delay between
+    the time it was due and the time its tick started. An *overrun* is a period of
+    a node which was skipped entirely, because the previous tick took too long or
+    ticks were late.
+    """
+
+    def __init__(self):
+        self.ticks = 0
+        self.updates = 0
+        self.overruns = 0
+        self.max_jitter = 0.0
+        self.total_jitter = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        return self.total_jitter / self.updates if self.updates > 0 else 0.0
+
+
+class Clock:
+    """
+    Updates registered nodes periodically, in one combined execution per tick.
+    Periods don't drift: the next update of a node is due one interval after the
+    previous one was due, not after it happened. Periods which have been missed
+    are skipped and counted as overruns in :code:`stats`.
+    """
+
+    def __init__(self, flow: Flow, time_func: Callable[[], float] = time.monotonic):
+        self.flow = flow
+        self.time_func = time_func
+        self.stats = ClockStats()
+
+        self.intervals: Dict[Node, float] = {}
+        self.due: Dict[Node, float] = {}
+        self.deliveries: Dict[NodeOutput, float] = {}   # due times of held back output values
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def register(self, node: Node, interval: float):
+        """Updates the node every ``interval`` seconds, starting one interval from now."""
+
+        if interval <= 0:
+            raise ValueError(f'Invalid clock interval: {interval}')
+
+        with self._lock:
+            self.intervals[node] = interval
+            self.due[node] = self.time_func() + interval
+        self._wakeup.set()
+
+    def unregister(self, node: Node):
+        with self._lock:
+            self.intervals.pop(node, None)
+            self.due.pop(node, None)
+
+    def schedule_delivery(self, out: NodeOutput, due: float):
+        """Sets the value held back by the output's coalescing policy once, at the given time."""
+
+        with self._lock:
+            if out in self.deliveries:
+                return
+            self.deliveries[out] = due
+        self._wakeup.set()
+
+    def cancel_delivery(self, out: NodeOutput):
+        with self._lock:
+            self.deliveries.pop(out, None)
+
+    def next_due(self) -> Optional[float]:
+        """Returns the time at which the next node or delivery is due, or None if there are none."""
+
+        with self._lock:
+            return min([*self.due.values(), *self.deliveries.values()], default=None)
+
+    def tick(self, now: Optional[float] = None) -> List[Node]:
+        """
+        Sets the held back output values which are due, updates all nodes which are due
+        in one combined execution, and returns the nodes.
+        """
+
+        if now is None:
+            now = self.time_func()
+
+        due_nodes = []
+        with self._lock:
+            due_outputs = [out for out, due in self.deliveries.items() if due <= now]
+            for out in due_outputs:
+                del self.deliveries[out]
+
+            for node, due in self.due.items():
+                if due > now:
+                    continue
+                due_nodes.append(node)
+
+                jitter = now - due
+                self.stats.updates += 1
+                self.stats.total_jitter += jitter
+                self.stats.max_jitter = max(self.stats.max_jitter, jitter)
+
+                interval = self.intervals[node]
+                missed = int(jitter // interval)
+                self.stats.overruns += missed
+                self.due[node] = due + (missed + 1) * interval
+
+        self.stats.ticks += 1
+        for out in due_outputs:
+            self.flow.deliver_coalesced(out)
+        if len(due_nodes) > 0:
+            if self.flow.triggers.running:
+                # the dispatcher thread runs all executions
+                for node in due_nodes:
+                    self.flow.triggers.update(node)
+            else:
+                self.flow.update_many(due_nodes)
+        return due_nodes
+
+    def start(self):
+        """Runs the clock in a daemon thread, where all periodic updates happen."""
+
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='ryvencore clock', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the clock thread, waiting for the current tick to finish."""
+
+        if self._thread is None:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while self._running:
+            next_due = self.next_due()
+            timeout = None if next_due is None else max(0.0, next_due - self.time_func())
+            # registrations and stop() wake the thread up early
+            if self._wakeup.wait(timeout):
+                self._wakeup.clear()
+                continue
+            self.tick()
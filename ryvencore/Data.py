@@ -7,7 +7,7 @@ pickle serializable by default can be used directly with :code`Data(my_data)`.
 from typing import Optional, Dict, List
 
 from ryvencore.Base import Base
-from ryvencore.utils import serialize, deserialize, print_err
+from ryvencore.utils import serialize, deserialize, fingerprint, print_err
 
 
 class Data(Base):
@@ -129,6 +129,31 @@ class Data(Base):
         """
         self.payload = data     # naive default implementation
 
+    def fingerprint(self):
+        """
+        *VIRTUAL*
+
+        Returns a hashable value which is equal for data objects of equal content. It is
+        used to recognize unchanged inputs of pure nodes (see :code:`Node.pure`).
+        By default, this is a digest of the pickled :code:`get_data()`, or the object's
+        identity if that cannot be pickled. Override this for large payloads which can
+        be compared more efficiently.
+        """
+        fp = fingerprint(self.get_data())
+        if fp is None:
+            return self.identifier, self.global_id
+        return self.identifier, fp
+
+    def equals(self, other: 'Data') -> bool:
+        """
+        *VIRTUAL*
+
+        Returns whether the other data object has the same content. Used to cut off
+        the propagation of unchanged outputs (see :code:`Node.early_cutoff`).
+        By default, this compares the :code:`fingerprint()` of both objects.
+        """
+        return self.fingerprint() == other.fingerprint()
+
     def data(self) -> Dict:
         return {
             **super().data(),
@@ -56,8 +56,112 @@ on a DP algorithm running in :math:`\\mathcal{O}(|V|+ |E|)` time, where
 :math:`|V|` is the number of nodes and
 :math:`|E|` is the number of edges.
 However, when there are multiple consecutive executions without
-any subsequent changes to the graph, this work does not need to be repeated and execution
-is fast.
+any subsequent changes to the analyzed part of the graph, this work does not need to be
+repeated and execution is fast.
+
+When several nodes are ready at the same time, the optimized algorithm handles the
+ones with the highest ``Node.priority`` first, including the predecessors of
+high-priority nodes. With the ``defer_below`` option, updates of low-priority nodes,
+like logging or previews, are collected and only run once ``Flow.run_deferred()`` is
+called, e.g. when the application is idle.
+
+**Memoized Data Flow**
+
+Nodes whose outputs only depend on their inputs and state can declare themselves
+``Node.pure``. The *memo* mode extends the optimized algorithm by caching the outputs
+of pure nodes, keyed by fingerprints of their input data and state, and reuses them
+instead of updating the node again when it is triggered with unchanged inputs.
+With the ``eliminate_duplicates`` option, pure nodes which are duplicates of each
+other (see ``Flow.duplicate_nodes()``) are also updated only once per *flow execution*,
+and all of them set the same ``Data`` objects on their outputs; the graph itself is
+not modified.
+
+**Lazy Data Flow**
+
+In the *lazy* mode, updates are not pushed through the graph. Updating a node or setting
+an output only marks everything downstream as outdated, and values are computed when
+they are read, through ``Node.input()`` or ``Flow.get()``, by pulling the outdated
+predecessors first. Parts of the flow which are never read, like previews which are
+not shown, don't cost anything.
+
+**Data Flow with Static Schedule**
+
+For large flows which are executed much more often than they are modified, the
+executor can compile the part of the graph which is reachable from the updated node
+or output into a *levelized topological schedule*, which is kept until the graph
+changes inside of it. A *flow execution* then walks the schedule instead of
+recursing through the nodes, and updates every node once all of its predecessors
+are done. As with the optimized algorithm, each *edge* is updated at most once per
+*flow execution*, and the same assumptions apply.
+
+**Cyclic Data Flow**
+
+Feedback loops, like control loops or iterative solvers, are supported by the *cyclic*
+mode. It decomposes the graph into its strongly connected components and walks them
+in topological order. The acyclic parts are updated like in the static schedule, while
+the nodes of every loop are updated repeatedly until their outputs converge (a fixed
+point is reached), or until an iteration limit is hit. Both the limit and the
+convergence test can be configured.
+
+**Parallel Data Flow**
+
+Based on the optimized algorithm, independent nodes can also be updated concurrently
+in a thread pool. A node is updated once all of its predecessors in the *flow execution*
+are done, and the nodes' events are still emitted by the thread which started the
+*flow execution*. This pays off when the nodes' update events release the GIL, e.g.
+for NumPy operations or I/O.
+For CPU-bound nodes, the *multi-process* mode additionally runs the update events of
+nodes with ``Node.run_in_process`` set in a pool of worker processes.
+
+**Asynchronous Data Flow**
+
+The *async* mode works like the parallel one, but runs the nodes as tasks on an
+asyncio event loop, where ``Node.update_event()`` can be a coroutine function.
+Nodes waiting for I/O then overlap instead of blocking the whole execution, and
+executions can be awaited through ``Node.update_async()`` and ``Flow.run_async()``.
+
+**Time-Sliced Data Flow**
+
+Applications which run ryvencore in a GUI or event loop can use the *sliced* mode,
+where updates are only queued, and the application calls ``Flow.run_slice()``
+repeatedly, e.g. whenever it is idle. Every call continues the queued executions
+for a small time budget and returns whether work is left, so the event loop is never
+blocked for long. Executions work like in the optimized algorithm.
+
+**Streaming Data Flow**
+
+In the *stream* mode, every connection holds a bounded queue of data items instead of a
+single value, and every node reachable from the updated one runs as a pipeline stage in
+its own thread. A source node can emit a whole stream of items in one update event, e.g.
+from a generator, by setting its output repeatedly. Its successors process the items
+while further ones are produced, and a full queue blocks the producer until the
+consumer caught up, which keeps the memory bounded for long-running streams.
+
+**Batched Data Flow**
+
+To evaluate a flow for many input records, ``Flow.run_batch()`` pushes a whole batch
+of values for some source outputs through the flow in one pass. Nodes can opt in to
+process whole batches at once (e.g. vectorized with NumPy) by setting
+``Node.batch_format``, while the update events of all other nodes are invoked for every
+item of the batch.
+
+**Coalesced Updates**
+
+Source nodes which set their outputs at a high frequency can declare
+``Node.coalesce`` policies for them. Values which arrive faster than the policy
+allows are held back or dropped before they cause any update events: *latest*
+delivers at most one value per interval and holds back the most recent one until
+``Flow.clock`` sets it when the interval ends, *rate* drops the values above a
+maximum rate, and *frame* holds back all values until the application calls
+``Flow.flush()``, e.g. once per frame.
+
+**Periodic and Concurrent Updates**
+
+The executors are not thread-safe. Periodic nodes register with ``Flow.clock``
+instead of running their own timers, and other threads enqueue their updates in
+``Flow.triggers``, which are run by a single dispatcher (see ``Clock`` and
+``TriggerQueue``). With the queue's *supersede* policy, new triggers for the nodes
+of the running batch cancel its remaining work, so obsolete executions don't pile up.
 
 **Execution Flow**
 
@@ -89,13 +193,15 @@ Assumptions:
 
 """
 from .Base import Base, Event
+from .Clock import Clock
+from .TriggerQueue import TriggerQueue, CancellationToken
 from .Data import Data
-from .FlowExecutor import DataFlowNaive, DataFlowOptimized, FlowExecutor, executor_from_flow_alg
+from .FlowExecutor import DataFlowNaive, DataFlowOptimized, DataFlowBatch, FlowExecutor, executor_from_flow_alg
 from .Node import Node
 from .NodePort import NodeOutput, NodeInput
 from .RC import FlowAlg, PortObjPos
 from .utils import *
-from typing import List, Dict, Optional, Tuple, Type
+from typing import List, Dict, Optional, Sequence, Set, Tuple, Type, Union
 
 
 class Flow(Base):
@@ -130,12 +236,24 @@ class Flow(Base):
         self.nodes: List[Node] = []
         self.load_data: Optional[Dict] = None
 
-        self.node_successors: Dict[Node, List[Node]] = {}   # additional data structure for executors
+        self.node_successors: Dict[Node, List[Node]] = {}   # additional data structures for executors
+        self.node_predecessors: Dict[Node, List[Node]] = {}
+        self._node_levels: Optional[Dict[Node, int]] = {}   # see node_levels(); None if outdated
+        self._cyclic = False
+        self._duplicates: Optional[Dict[Node, Node]] = None     # see duplicate_nodes(); None if outdated
+        self._constants: Optional[Set[Node]] = None             # see constant_nodes(); None if outdated
+        self._priorities: Optional[Dict[Node, int]] = None      # see node_priorities(); None if outdated
+        self._coalesced_outputs: Dict[NodeOutput, Data] = {}    # values held back by Node.coalesce
+        self._last_deliveries: Dict[NodeOutput, float] = {}
+        self._folded: Dict[Node, bytes] = {}                    # state fingerprints of the frozen constant nodes
         self.graph_adj: Dict[NodeOutput, List[NodeInput]] = {}         # directed adjacency list relating node ports
         self.graph_adj_rev: Dict[NodeInput, Optional[NodeOutput]] = {}     # reverse adjacency; reverse of graph_adj
 
         self.alg_mode = FlowAlg.DATA
         self.executor: FlowExecutor = executor_from_flow_alg(self.alg_mode)(self)
+        self.clock = Clock(self)    # owns the periodic updates of nodes
+        self.triggers = TriggerQueue(self)  # updates from other threads
+        self.cancellation = CancellationToken()  # of the trigger batch being dispatched
 
     def load(self, data: Dict):
         """Loading a flow from data as previously returned by ``Flow.data()``."""
@@ -162,6 +280,8 @@ class Flow(Base):
         for n in new_nodes:
             n.rebuilt()
 
+        self.fold_constants()
+
         return new_nodes, new_conns
 
 
@@ -245,6 +365,13 @@ class Flow(Base):
         self.nodes.append(node)
 
         self.node_successors[node] = []
+        self.node_predecessors[node] = []
+        if self._node_levels is not None:
+            self._node_levels[node] = 0
+        if self._constants is not None and node.pure:
+            self._constants.add(node)
+        if self._priorities is not None:
+            self._priorities[node] = node.priority
 
         # catch up on node ports
         # notice that add_node_output() and add_node_input() are called by Node.
@@ -257,7 +384,7 @@ class Flow(Base):
             # self.graph_adj_rev[inp] = None
 
         node.after_placement()
-        self._flow_changed()
+        self._flow_changed(node)
 
         self.node_added.emit(node)
 
@@ -272,6 +399,17 @@ class Flow(Base):
         self.nodes.remove(node)
 
         del self.node_successors[node]
+        del self.node_predecessors[node]
+        if self._cyclic:
+            # the node might have been part of a cycle
+            self._node_levels = None
+            self._cyclic = False
+        elif self._node_levels is not None:
+            del self._node_levels[node]
+        if self._constants is not None:
+            self._constants.discard(node)
+        if self._priorities is not None:
+            self._priorities.pop(node, None)
         for out in node.outputs:
             self.remove_node_output(node, out, False)
             # del self.graph_adj[out]
@@ -279,7 +417,7 @@ class Flow(Base):
             self.remove_node_input(node, inp, False)
             # del self.graph_adj_rev[inp]
 
-        self._flow_changed()
+        self._flow_changed(node)
 
         # notify addons
         for addon in self.session.addons.values():
@@ -293,7 +431,7 @@ class Flow(Base):
         if node in self.node_successors:
             self.graph_adj_rev[inp] = None
             if _call_flow_changed:
-                self._flow_changed()
+                self._flow_changed(node)
 
 
     def add_node_output(self, node: Node, out: NodeOutput, _call_flow_changed=True):
@@ -301,7 +439,7 @@ class Flow(Base):
         if node in self.node_successors:
             self.graph_adj[out] = []
             if _call_flow_changed:
-                self._flow_changed()
+                self._flow_changed(node)
 
 
     def remove_node_input(self, node: Node, inp: NodeInput, _call_flow_changed=True):
@@ -309,7 +447,7 @@ class Flow(Base):
         if node in self.node_successors:
             del self.graph_adj_rev[inp]
             if _call_flow_changed:
-                self._flow_changed()
+                self._flow_changed(node)
 
 
     def remove_node_output(self, node: Node, out: NodeOutput, _call_flow_changed=True):
@@ -317,7 +455,7 @@ class Flow(Base):
         if node in self.node_successors:
             del self.graph_adj[out]
             if _call_flow_changed:
-                self._flow_changed()
+                self._flow_changed(node)
 
 
     def _connect_nodes_from_data(self, nodes: List[Node], data: List):
@@ -412,7 +550,18 @@ class Flow(Base):
         self.graph_adj_rev[inp] = out
 
         self.node_successors[out.node].append(inp.node)
-        self._flow_changed()
+        self.node_predecessors[inp.node].append(out.node)
+        if self._node_levels is not None and not self._raise_levels(out.node, inp.node):
+            # the connection closes a cycle
+            self._node_levels = None
+            self._cyclic = True
+        if self._node_levels is None:
+            # the connection might close a cycle of constant nodes
+            self._constants = None
+        self._update_constants(inp.node)
+        self._raise_priorities(out.node, inp.node)
+        self._folded.pop(inp.node, None)
+        self._flow_changed(out.node)
 
 
         self.executor.conn_added(out, inp, silent=silent)
@@ -431,7 +580,16 @@ class Flow(Base):
         self.graph_adj_rev[inp] = None
 
         self.node_successors[out.node].remove(inp.node)
-        self._flow_changed()
+        self.node_predecessors[inp.node].remove(out.node)
+        if self._cyclic:
+            # the connection might have been part of a cycle;
+            # removing connections never invalidates the levels otherwise
+            self._node_levels = None
+            self._cyclic = False
+        self._update_constants(inp.node)
+        self._lower_priorities(out.node, inp.node)
+        self._folded.pop(inp.node, None)
+        self._flow_changed(out.node)
 
         self.executor.conn_removed(out, inp, silent=silent)
 #
@@ -453,6 +611,148 @@ class Flow(Base):
         return self.graph_adj_rev[inp]
 
 
+    def get(self, out: NodeOutput) -> Optional[Data]:
+        """
+        Returns the value of the given data output. In the 'data lazy' algorithm
+        mode, this first computes the output if it is outdated.
+        """
+        return self.executor.get_output_val(out)
+
+
+    def update_many(self, roots: Sequence[Union[Node, NodeOutput]]):
+        """
+        Updates several nodes, and propagates the current values of several outputs,
+        in one combined execution. In the 'data opt', 'data sched', 'data parallel',
+        'data process', 'data async', and 'data memo' modes, every connection is then
+        activated at most once, even if it is reachable from multiple roots, so shared
+        successors are updated only once for each of their inputs. The other modes
+        update the roots one after another.
+        """
+        self.executor.update_many(tuple(roots))
+
+
+    async def run_async(self, nodes: Optional[List[Node]] = None):
+        """
+        Updates the given nodes, or all nodes without predecessors if :code:`None`,
+        and returns once the resulting execution has finished. Like
+        :code:`update_many()`, the nodes are updated in one combined execution.
+        See also :code:`Node.update_async()`.
+        """
+
+        if nodes is None:
+            nodes = [n for n in self.nodes if len(self.node_predecessors[n]) == 0]
+
+        await self.executor.update_many_async(tuple(nodes))
+
+
+    def run_batch(
+            self,
+            inputs: Dict[NodeOutput, List[Data]],
+            outputs: Optional[List[NodeOutput]] = None,
+    ) -> Dict[NodeOutput, List[Optional[Data]]]:
+        """
+        Pushes a batch of items through the flow in one pass, where :code:`inputs`
+        maps source outputs to one :code:`Data` object per item. Nodes with
+        :code:`Node.batch_format` set process the whole batch at once, all others
+        are updated for every item. Returns the values of the given outputs (by
+        default all outputs updated in the batch) for every item.
+        Afterwards, the outputs hold the values of the last item.
+        See :code:`DataFlowBatch`.
+        """
+
+        size = len(next(iter(inputs.values()))) if len(inputs) > 0 else 0
+        batch_executor = DataFlowBatch(self, size)
+
+        executor = self.executor
+        self.executor = batch_executor
+        try:
+            batch_executor.run(inputs)
+        finally:
+            self.executor = executor
+
+        if outputs is None:
+            outputs = list(batch_executor.batches)
+        return {
+            out: batch_executor.items(out)
+            if out in batch_executor.batches else [out.val] * size
+            for out in outputs
+        }
+
+
+    def coalesce_output(self, node: Node, index: int, data: Data) -> bool:
+        """
+        Called by ``Node.set_output_val()`` for nodes with ``Node.coalesce`` set.
+        Returns True if the value is held back or dropped according to the output's
+        policy, and False if it should be set right away.
+        """
+
+        policies = node.coalesce
+        if policies is None:
+            return False
+        policy = policies.get(index, policies.get(-1))
+        if policy is None:
+            return False
+
+        mode, param = policy
+        out = node.outputs[index]
+        if mode == 'frame':
+            self._coalesced_outputs[out] = data
+            return True
+        elif mode == 'latest':
+            interval = param
+        elif mode == 'rate':
+            interval = 1 / param
+        else:
+            raise ValueError(f'Invalid coalescing mode: {mode}')
+
+        now = self.clock.time_func()
+        last = self._last_deliveries.get(out)
+        if last is not None and now - last < interval:
+            if mode == 'latest':
+                self._coalesced_outputs[out] = data
+                # the most recent value is delivered when the interval ends
+                self.clock.schedule_delivery(out, last + interval)
+            return True
+
+        self._last_deliveries[out] = now
+        self._coalesced_outputs.pop(out, None)
+        self.clock.cancel_delivery(out)
+        return False
+
+
+    def deliver_coalesced(self, out: NodeOutput):
+        """
+        Sets the value held back by the output's *latest* policy once its interval
+        has ended. Called by ``Flow.clock``, see ``coalesce_output()``.
+        """
+
+        data = self._coalesced_outputs.pop(out, None)
+        if data is None or out.node not in self.node_successors:
+            return
+        # goes through the policy again, which delivers it, or holds it back once more
+        if self.triggers.running:
+            # the dispatcher thread runs all executions
+            self.triggers.set_output_val(out.node, out.node.outputs.index(out), data)
+        else:
+            out.node.set_output_val(out.node.outputs.index(out), data)
+
+
+    def flush(self):
+        """
+        Sets the output values held back by ``Node.coalesce`` policies (the most recent
+        one for every output), one after another. See ``coalesce_output()``.
+        """
+
+        coalesced, self._coalesced_outputs = self._coalesced_outputs, {}
+        for out, data in coalesced.items():
+            if out.node not in self.node_successors:
+                # removed in the meantime
+                continue
+            self._last_deliveries[out] = self.clock.time_func()
+            self.clock.cancel_delivery(out)
+            self.executor.set_output_val(out.node, out.node.outputs.index(out), data)
+
+
     def algorithm_mode(self) -> str:
         """
         Returns the current algorithm mode of the flow as string.
@@ -461,25 +761,336 @@ class Flow(Base):
         return FlowAlg.str(self.alg_mode)
 
 
-    def set_algorithm_mode(self, mode: str):
+    def set_algorithm_mode(self, mode: str, **options):
         """
         Sets the algorithm mode of the flow from a string, possible values
-        are 'data', 'data opt', and 'exec'.
+        are 'data', 'data opt', 'data sched', 'data parallel', 'data process',
+        'data async', 'data stream', 'data memo', 'data lazy', 'data cyclic', 'data sliced',
+        and 'exec'.
+        Additional keyword arguments are passed to the executor, e.g.
+        :code:`flow.set_algorithm_mode('data parallel', max_workers=8)` or
+        :code:`flow.set_algorithm_mode('data cyclic', max_iterations=1000)`.
         """
 
         new_alg_mode = FlowAlg.from_str(mode)
         if new_alg_mode is None:
             return False
 
-        self.executor = executor_from_flow_alg(new_alg_mode)(self)
+        self.executor.shutdown()
+        self.executor = executor_from_flow_alg(new_alg_mode)(self, **options)
         self.alg_mode = new_alg_mode
         self.algorithm_mode_changed.emit(self.algorithm_mode())
 
         return True
 
 
-    def _flow_changed(self):
-        self.executor.flow_changed = True
+    def node_levels(self) -> Optional[Dict[Node, int]]:
+        """
+        Returns a topological level for every node, such that every node's level is
+        larger than the levels of all its predecessors, or :code:`None` if the graph
+        contains cycles. The levels are maintained incrementally when the graph
+        changes; they are not necessarily the smallest possible ones.
+        """
+
+        if self._node_levels is None and not self._cyclic:
+            self._node_levels = self._compute_levels()
+            self._cyclic = self._node_levels is None
+
+        return self._node_levels
+
+
+    def _compute_levels(self) -> Optional[Dict[Node, int]]:
+        """computes the levels from scratch; returns None if the graph is cyclic"""
+
+        num_preds = {n: len(self.node_predecessors[n]) for n in self.nodes}
+        levels = {}
+        level = [n for n in self.nodes if num_preds[n] == 0]
+        depth = 0
+        while len(level) > 0:
+            next_level = []
+            for n in level:
+                levels[n] = depth
+                for s in self.node_successors[n]:
+                    num_preds[s] -= 1
+                    if num_preds[s] == 0:
+                        next_level.append(s)
+            level = next_level
+            depth += 1
+
+        if len(levels) < len(self.nodes):
+            return None
+        return levels
+
+
+    def _raise_levels(self, pred: Node, node: Node) -> bool:
+        """
+        Restores the level invariant after a new connection from ``pred`` to
+        ``node`` by raising the levels of ``node`` and its successors where necessary.
+        Only the successors whose levels actually change are visited.
+        Returns False if the new connection closes a cycle.
+        """
+
+        levels = self._node_levels
+        assert levels is not None
+
+        if levels[node] > levels[pred]:
+            return True
+
+        levels[node] = levels[pred] + 1
+        stack = [node]
+        while len(stack) > 0:
+            n = stack.pop()
+            min_level = levels[n] + 1
+            for s in self.node_successors[n]:
+                if levels[s] < min_level:
+                    if s is pred:
+                        return False
+                    levels[s] = min_level
+                    stack.append(s)
+
+        return True
+
+
+    def duplicate_nodes(self) -> Dict[Node, Node]:
+        """
+        Finds pure nodes (see ``Node.pure``) which are structural duplicates of
+        another node: nodes of the same class and with the same number of outputs,
+        whose inputs are connected to the same outputs (or to the outputs of duplicates
+        of the same nodes). Returns a dict mapping every duplicate to its
+        representative, the first of its duplicates in the flow.
+        The result is cached until the graph changes.
+
+        Duplicates only compute the same if their states and unconnected inputs'
+        default values are equal too, which can change without changes to the graph,
+        so executors must still compare them before sharing results.
+        """
+
+        if self._duplicates is None:
+            self._duplicates = self._find_duplicates()
+        return self._duplicates
+
+
+    def _find_duplicates(self) -> Dict[Node, Node]:
+        """hash-conses the pure nodes in topological order"""
+
+        levels = self.node_levels()
+        if levels is not None:
+            nodes = sorted(self.nodes, key=levels.__getitem__)
+        else:
+            # in cyclic graphs, sources which are visited later are not resolved
+            # to their representatives, so fewer duplicates are found
+            nodes = self.nodes
+
+        representatives: Dict[Tuple, Node] = {}
+        duplicates: Dict[Node, Node] = {}
+        for node in nodes:
+            if not node.pure:
+                continue
+
+            sources: List[Optional[Tuple[Node, int]]] = []
+            for inp in node.inputs:
+                out = self.graph_adj_rev[inp]
+                if out is None:
+                    sources.append(None)
+                else:
+                    source = duplicates.get(out.node, out.node)
+                    sources.append((source, out.node.outputs.index(out)))
+
+            key = (type(node), len(node.outputs), tuple(sources))
+            rep = representatives.setdefault(key, node)
+            if rep is not node:
+                duplicates[node] = rep
+
+        return duplicates
+
+
+    def constant_nodes(self) -> Set[Node]:
+        """
+        Returns the pure nodes (see ``Node.pure``) whose inputs are all unconnected or
+        connected to other constant nodes. Their outputs only depend on their states
+        and the default values of their inputs, so they don't change between
+        executions. The result is maintained incrementally when connections change.
+        """
+
+        if self._constants is None:
+            levels = self.node_levels()
+            # in cyclic graphs, predecessors which are visited later are
+            # not constant yet, so nodes in cycles are never constant
+            nodes = self.nodes if levels is None else sorted(self.nodes, key=levels.__getitem__)
+
+            constants = set()
+            for node in nodes:
+                if node.pure and all(p in constants for p in self.node_predecessors[node]):
+                    constants.add(node)
+            self._constants = constants
+
+        return self._constants
+
+
+    def _update_constants(self, node: Node):
+        """re-evaluates whether the node is constant after its input connections
+        changed, and the successors whose predecessors' status changed"""
+
+        constants = self._constants
+        if constants is None:
+            return
+
+        stack = [node]
+        while len(stack) > 0:
+            n = stack.pop()
+            constant = n.pure and all(p in constants for p in self.node_predecessors[n])
+            if constant == (n in constants):
+                continue
+            if constant:
+                constants.add(n)
+            else:
+                constants.discard(n)
+            stack.extend(self.node_successors[n])
+
+
+    def fold_constants(self):
+        """
+        Evaluates the constant nodes (see ``constant_nodes()``) which are not frozen
+        yet, in one combined execution (see ``update_many()``). This is done
+        automatically after loading.
+
+        A constant node is frozen once it has been updated while all its constant
+        predecessors were frozen; it then ignores direct updates (:code:`inp=-1`) until
+        its state changes. Updates through its inputs, e.g. when a constant predecessor's
+        state changed, or changes to its ports or connections unfreeze it.
+        """
+
+        constants = self.constant_nodes()
+        roots = [
+            n for n in self.nodes
+            if n in constants and n not in self._folded
+            and all(p in self._folded for p in self.node_predecessors[n])
+        ]
+        if len(roots) > 0:
+            self.update_many(roots)
+
+
+    def check_folded_update(self, node: Node, inp: int) -> bool:
+        """
+        Called by ``Node.update()``. Returns True if the update can be skipped because
+        the node is frozen (see ``fold_constants()``), and otherwise updates the frozen
+        nodes for the upcoming update event.
+        """
+
+        if not node.pure or node not in self.constant_nodes():
+            return False
+
+        state = fingerprint(node.get_state())
+        if inp == -1 and state is not None and self._folded.get(node) == state:
+            return True
+
+        if state is not None and all(p in self._folded for p in self.node_predecessors[node]):
+            self._folded[node] = state
+        else:
+            self._folded.pop(node, None)
+        # the successors receive new data
+        for s in self.node_successors[node]:
+            self._folded.pop(s, None)
+
+        return False
+
+
+    def node_priorities(self) -> Dict[Node, int]:
+        """
+        Returns the effective priority of every node: the largest ``Node.priority``
+        of the node and all nodes reachable from it, so that the whole path to a
+        critical node is preferred. The result is maintained incrementally when
+        connections change.
+        """
+
+        if self._priorities is None:
+            priorities = {n: n.priority for n in self.nodes}
+            # nothing to propagate if all nodes have the default priority
+            stack = [n for n in self.nodes if n.priority != 0]
+            while len(stack) > 0:
+                n = stack.pop()
+                for p in self.node_predecessors[n]:
+                    if priorities[p] < priorities[n]:
+                        priorities[p] = priorities[n]
+                        stack.append(p)
+            self._priorities = priorities
+
+        return self._priorities
+
+
+    def _raise_priorities(self, pred: Node, succ: Node):
+        """propagates the priority of succ to its new predecessor pred"""
+
+        priorities = self._priorities
+        if priorities is None:
+            return
+
+        prio = priorities[succ]
+        stack = [pred]
+        while len(stack) > 0:
+            n = stack.pop()
+            if priorities[n] >= prio:
+                continue
+            priorities[n] = prio
+            stack.extend(self.node_predecessors[n])
+
+
+    def _lower_priorities(self, pred: Node, succ: Node):
+        """recomputes the priorities of pred and its predecessors after the
+        connection to succ was removed"""
+
+        priorities = self._priorities
+        if priorities is None or priorities[succ] <= pred.priority or priorities[succ] < priorities[pred]:
+            # pred didn't inherit its priority from succ
+            return
+
+        # only the nodes from which pred is reachable can be affected
+        affected = {pred}
+        stack = [pred]
+        while len(stack) > 0:
+            for p in self.node_predecessors[stack.pop()]:
+                if p not in affected:
+                    affected.add(p)
+                    stack.append(p)
+
+        for n in affected:
+            priorities[n] = max(
+                [n.priority] + [priorities[s] for s in self.node_successors[n] if s not in affected]
+            )
+        stack = list(affected)
+        while len(stack) > 0:
+            n = stack.pop()
+            for p in self.node_predecessors[n]:
+                if priorities[p] < priorities[n]:
+                    priorities[p] = priorities[n]
+                    stack.append(p)
+
+
+    def run_slice(self, budget: Optional[float] = None) -> bool:
+        """
+        In the 'data sliced' mode, continues the queued executions for ``budget``
+        seconds (by default the executor's ``slice_budget``), and returns whether
+        there is work left. Returns False in all other modes, which don't queue
+        executions. See ``DataFlowSliced``.
+        """
+        return self.executor.run_slice(budget)
+
+
+    def run_deferred(self) -> bool:
+        """
+        Runs the update events which the executor deferred because of their low
+        priority, e.g. when the application is idle. Returns whether there were any.
+        See ``Node.priority``.
+        """
+        return self.executor.run_deferred()
+
+
+    def _flow_changed(self, *nodes: Node):
+        """notifies the executor that the ports or outgoing connections of ``nodes`` changed"""
+        self._duplicates = None
+        for n in nodes:
+            self._folded.pop(n, None)
+        self.executor.graph_changed(nodes)
 
 
     def data(self) -> dict:
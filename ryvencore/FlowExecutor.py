@@ -9,11 +9,22 @@ if TYPE_CHECKING:
     from .Flow import Flow
     from .Node import Node
 
-from typing import Optional
+import asyncio
+import heapq
+import importlib
+import inspect
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Callable, Optional, Dict, List, Set, Tuple, Union
 
 from .Data import Data
 from .NodePort import NodeOutput, NodeInput
 from .RC import FlowAlg
+from .utils import serialize, deserialize, fingerprint
 
 
 """
@@ -24,6 +35,19 @@ graph_adjacency = {
 """
 
 
+def data_equal(old: Optional[Data], new: Optional[Data]) -> bool:
+    """compares two output values using ``Data.equals()``"""
+    if old is None or new is None:
+        return old is new
+    return old is new or old.equals(new)
+
+
+def output_unchanged(out: NodeOutput, data: Optional[Data]) -> bool:
+    """whether the output's node cuts off the propagation of unchanged values
+    (see ``Node.early_cutoff``), and the data equals the output's current value"""
+    return out.node.early_cutoff and out.type_ == 'data' and data_equal(out.val, data)
+
+
 class FlowExecutor:
     """
     Base class for special flow execution algorithms.
@@ -39,6 +63,31 @@ class FlowExecutor:
     def update_node(self, node: Node, inp: int):
         pass
 
+    # Node.update_async() =>
+    async def update_node_async(self, node: Node, inp: int):
+        self.update_node(node, inp)
+
+    # Flow.update_many() =>
+    def update_many(self, roots: Tuple[Union[Node, NodeOutput], ...]) -> None:
+        """
+        Updates several nodes, or propagates the current values of several outputs,
+        which is done one after another by default. Executors which analyze the
+        graph run them in one combined execution instead.
+        """
+        for root in roots:
+            if isinstance(root, NodeOutput):
+                index = root.node.outputs.index(root)
+                if root.type_ == 'exec':
+                    root.node.exec_output(index)
+                elif root.val is not None:
+                    root.node.set_output_val(index, root.val)
+            else:
+                root.update()
+
+    # Flow.run_async() =>
+    async def update_many_async(self, roots: Tuple[Union[Node, NodeOutput], ...]) -> None:
+        self.update_many(roots)
+
     # Node.input() =>
     def input(self, node: Node, index: int) -> Optional[Data]:
         pass
@@ -51,12 +100,49 @@ class FlowExecutor:
     def exec_output(self, node: Node, index: int) -> None:
         pass
 
+    # Flow.get() =>
+    def get_output_val(self, out: NodeOutput) -> Optional[Data]:
+        return out.val
+
     def conn_added(self, out: NodeOutput, inp: NodeInput, silent=False) -> None:
         pass
 
     def conn_removed(self, out: NodeOutput, inp: NodeInput, silent=False) -> None:
         pass
 
+    # Flow._flow_changed() =>
+    def graph_changed(self, nodes: Tuple[Node, ...]) -> None:
+        """
+        Called by the flow after a structural change of the graph. ``nodes`` are
+        the nodes whose ports or outgoing connections changed, so any analysis of
+        a subgraph which does not contain any of them is still valid.
+        """
+        self.flow_changed = True
+
+    # Flow.run_slice() =>
+    def run_slice(self, budget: Optional[float] = None) -> bool:
+        """
+        Continues pending executions for about ``budget`` seconds, if the executor
+        runs them in slices. Returns whether there is work left.
+        """
+        return False
+
+    # Flow.run_deferred() =>
+    def run_deferred(self) -> bool:
+        """
+        Runs the update events which were deferred to idle time, if the executor
+        defers any. Returns whether there were any.
+        """
+        return False
+
+    # Flow.set_algorithm_mode() =>
+    def shutdown(self) -> None:
+        """
+        Called by the flow when the executor is replaced; releases resources
+        like worker threads.
+        """
+        pass
+
 
 class DataFlowNaive(FlowExecutor):
     """
@@ -65,16 +151,39 @@ class DataFlowNaive(FlowExecutor):
     if performed, and some types of graphs can run really slow here, especially if they
     include "diamonds".
 
+    Propagation is not recursive: the updates of the successors are pushed onto a work
+    stack which the update (or output) that started the propagation processes in a loop.
+    The updates caused by an update event are processed before the ones already on the
+    stack, so the order is the same depth-first order as with recursive propagation.
+    If an update event sets an output again before its successors have been updated,
+    the updates scheduled so far are processed first, so the successors see every value
+    in the order it was set. The depth of the graph is therefore only limited by the
+    available memory, unless nodes set the same output several times at every level.
+
     Assumptions for the graph:
     - no non-terminating feedback loops
     """
 
+    def __init__(self, flow: Flow):
+        super().__init__(flow)
+
+        self.work: Optional[List[Tuple[Node, int]]] = None   # the stack of pending updates during propagation
+        self.scheduled: List[Tuple[Node, int]] = []          # the updates caused by the current update event
+        self.emitted: Set[NodeOutput] = set()                # the outputs whose updates are scheduled
+
     # Node.update() =>
     def update_node(self, node: Node, inp: int):
-        try:
-            node.update_event(inp)
-        except Exception as e:
-            node.update_err(e)
+        if self.work is None:  # propagation starter!
+            self.work = []
+            try:
+                self.invoke_node_update_event(node, inp)
+                self.run_work()
+            finally:
+                self.work = None
+                self.scheduled = []
+                self.emitted = set()
+        else:
+            self.invoke_node_update_event(node, inp)
 
     # Node.input() =>
     def input(self, node: Node, index: int):
@@ -91,10 +200,14 @@ class DataFlowNaive(FlowExecutor):
         out = node.outputs[index]
         if not out.type_ == 'data':
             return
+        if out in self.emitted:
+            self.flush_scheduled()
+        if output_unchanged(out, data):
+            out.val = data
+            return
         out.val = data
 
-        for inp in self.graph[out]:
-            inp.node.update(inp=inp.node.inputs.index(inp))
+        self.schedule_successors(out)
 
     # Node.exec_output() =>
     def exec_output(self, node: Node, index: int):
@@ -102,20 +215,201 @@ class DataFlowNaive(FlowExecutor):
         if not out.type_ == 'exec':
             return
 
-        for inp in self.graph[out]:
-            inp.node.update(inp=inp.node.inputs.index(inp))
+        if out in self.emitted:
+            self.flush_scheduled()
+        self.schedule_successors(out)
 
     def conn_added(self, out: NodeOutput, inp: NodeInput, silent=False):
         if not silent:
             # update input
             inp.node.update(inp=inp.node.inputs.index(inp))
 
+    """
+
+    Helper methods
+
+    """
+
+    def invoke_node_update_event(self, node: Node, inp: int):
+        try:
+            node.update_event(inp)
+        except Exception as e:
+            node.update_err(e)
+
+    def update_node_inputs(self, node: Node, inps: List[int]):
+        """updates the node for every input which received data, or only once if it joins its inputs
+        or is updated as a whole (-1) anyway"""
+
+        if node.join_inputs:
+            node.updated_inputs = [inp for inp in inps if inp != -1]
+            node.update(inp=-1)
+        elif -1 in inps:
+            node.update(inp=-1)
+        else:
+            for inp in inps:
+                node.update(inp=inp)
+
+    def schedule_successors(self, out: NodeOutput):
+        """schedules the updates of the inputs connected to the output"""
+
+        inps = self.graph[out]
+        if len(inps) == 0:
+            return
+        for inp in inps:
+            self.scheduled.append((inp.node, inp.node.inputs.index(inp)))
+        self.emitted.add(out)
+
+        if self.work is None:  # propagation starter!
+            self.work = []
+            try:
+                self.run_work()
+            finally:
+                self.work = None
+                self.scheduled = []
+                self.emitted = set()
+
+    def run_work(self):
+        """processes the work stack until all scheduled updates are done"""
+
+        work = self.work
+        while True:
+            if len(self.scheduled) > 0:
+                # the first scheduled update goes on top
+                work.extend(reversed(self.scheduled))
+                self.scheduled = []
+                self.emitted = set()
+            if len(work) == 0:
+                break
+            node, inp = work.pop()
+            node.update(inp=inp)
+
+    def flush_scheduled(self):
+        """
+        Processes the updates scheduled by the current update event so far, with a nested
+        work stack, before it sets an output again whose successors haven't been updated
+        yet. Otherwise, they would only see the last value of the output.
+        """
+
+        if self.work is None or len(self.scheduled) == 0:
+            return
+        work, self.work = self.work, []
+        try:
+            self.run_work()
+        finally:
+            self.work = work
+
     def conn_removed(self, out, inp, silent=False):
         if not silent:
             # update input
             inp.node.update(inp=inp.node.inputs.index(inp))
 
 
+class PlanCache:
+    """
+    A bounded cache for execution plans (the results of an executor's graph analysis),
+    keyed by the execution root (a Node or NodeOutput). When the cache is full, the
+    least recently used plan is evicted. Every plan is stored with the set of nodes
+    it covers, and it is invalidated once the graph changes at any of them.
+    """
+
+    def __init__(self, capacity: int = 32):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+
+        self._plans: OrderedDict = OrderedDict()    # root -> (plan, nodes)
+        self._roots_by_node: Dict[Node, Set] = {}
+
+    def __len__(self):
+        return len(self._plans)
+
+    def __contains__(self, root):
+        return root in self._plans
+
+    def get(self, root):
+        """returns the plan for the root, or None if there is none"""
+
+        entry = self._plans.get(root)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._plans.move_to_end(root)
+        return entry[0]
+
+    def put(self, root, plan, nodes: Set[Node]):
+        """caches the plan for the root, covering the given nodes"""
+
+        if self.capacity <= 0:
+            return
+
+        self.drop(root)
+        self._plans[root] = (plan, nodes)
+        for n in nodes:
+            if n in self._roots_by_node:
+                self._roots_by_node[n].add(root)
+            else:
+                self._roots_by_node[n] = {root}
+
+        while len(self._plans) > self.capacity:
+            self.drop(next(iter(self._plans)))
+
+    def drop(self, root):
+        """removes the plan for the root"""
+
+        entry = self._plans.pop(root, None)
+        if entry is None:
+            return
+
+        for n in entry[1]:
+            roots = self._roots_by_node[n]
+            roots.discard(root)
+            if len(roots) == 0:
+                del self._roots_by_node[n]
+
+    def invalidate(self, nodes):
+        """removes all plans covering any of the nodes"""
+
+        for n in nodes:
+            for root in list(self._roots_by_node.get(n, ())):
+                self.drop(root)
+
+    def clear(self):
+        self._plans.clear()
+        self._roots_by_node.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'size': len(self._plans),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class ExecutionPlan:
+    """
+    The result of the graph analysis of ``DataFlowOptimized`` for an execution root:
+    the nodes reachable from the root, the number of connections from which each
+    of them can receive data during an execution, and the outputs of every node
+    which can be affected (see ``Node.output_dependencies``). The connected inputs of
+    outputs whose successors have different priorities are sorted by priority.
+    """
+
+    def __init__(
+            self,
+            nodes: Set[Node],
+            num_conns_from_predecessors: Dict[Node, int],
+            outputs: Dict[Node, List[NodeOutput]],
+            successors: Dict[NodeOutput, List[NodeInput]],
+    ):
+        self.nodes = nodes
+        self.num_conns_from_predecessors = num_conns_from_predecessors
+        self.outputs = outputs
+        self.successors = successors
+
+
 class DataFlowOptimized(DataFlowNaive):
     """
     *(see also documentation in Flow)*
@@ -133,51 +427,121 @@ class DataFlowOptimized(DataFlowNaive):
     execution where any two executed branches which merge again in the future result in two
     complete executions of everything that comes after the merge, which quickly produces
     exponential performance issues.
+
+    The analysis results are cached per execution root in a ``PlanCache`` of
+    ``plan_cache_size`` plans, so that executions which alternate between different
+    roots don't need to repeat it either.
+
+    The analysis follows the declared ``Node.output_dependencies``: only the outputs
+    which depend on the inputs that can receive data in the execution (or, for the
+    root node, on the updated input) are part of it and get propagated.
+
+    Nodes with ``Node.join_inputs`` set are updated only once, when their wait count
+    reaches zero, i.e. when all their inputs have settled.
+
+    ``Flow.update_many()`` runs a single execution for several roots, based on the
+    analysis of the union of their successors, so every connection is still activated
+    at most once. Roots which are reachable from other roots are updated only once,
+    after their inputs have settled.
+
+    Ready nodes are kept in a priority queue ordered by their effective priorities
+    (see ``Flow.node_priorities()``), and the successors of an output are updated
+    in that order too, so the paths to critical nodes finish first. Updates of nodes
+    whose effective priority is below ``defer_below`` are deferred: they are not
+    invoked in the execution, but collected until ``Flow.run_deferred()`` is called.
     """
 
-    def __init__(self, flow):
+    def __init__(self, flow, plan_cache_size: int = 32, defer_below: Optional[int] = None):
         super().__init__(flow)
 
-        self.output_updated = {}
-        self.waiting_count = {}
-        self.node_waiting = {}
-        self.num_conns_from_predecessors = None
-        self.last_execution_root = None     # for reuse when a same execution is invoked many times consecutively
+        self.execution_epoch = 0            # counts executions
+        self.output_updated: Dict[NodeOutput, int] = {}     # output -> epoch of its last update
+        self.waiting_count: Dict[Node, int] = {}
+        self.plan: Optional[ExecutionPlan] = None
+        self.plan_cache = PlanCache(plan_cache_size)
         self.execution_root = None          # can be Node or NodeOutput
         self.execution_root_node = None     # the updated Node or the updated NodeOutput's Node
+        self.ready_nodes: List[Tuple[int, int, Node]] = []  # heap of nodes whose outputs can be propagated
+        self.ready_count = itertools.count()  # breaks ties in ready_nodes, most recent first
+        self.priorities: Dict[Node, int] = {}
+        self.defer_below = defer_below
+        self.deferred: Dict[Node, List[int]] = {}   # deferred update events
+        self.joined_inputs: Dict[Node, List[int]] = {}  # inputs of join nodes which received data
 
     # NODE FUNCTIONS
 
     # Node.update() =>
     def update_node(self, node, inp=-1):
         if self.execution_root_node is None:  # execution starter!
-            self.start_execution(root_node=node)
+            self.start_execution(root_node=node, root_inp=inp)
             self.invoke_node_update_event(node, inp)
             self.propagate_outputs(node)
+            self.propagate_ready_nodes()
             self.stop_execution()
         else:
             self.invoke_node_update_event(node, inp)
 
+    # Flow.update_many() =>
+    def update_many(self, roots):
+        if self.execution_root_node is not None:
+            # inside an execution
+            super().update_many(roots)
+            return
+
+        roots = tuple(dict.fromkeys(roots))
+        if len(roots) == 0:
+            return
+        self.start_execution(roots=roots)
+        for root in roots:
+            if isinstance(root, NodeOutput):
+                continue
+            if self.root_waits(root):
+                self.add_pending_input(root, -1)
+            else:
+                root.update()
+        self.propagate_roots(roots)
+        self.propagate_ready_nodes()
+        self.stop_execution()
+
+    # Flow.run_deferred() =>
+    def run_deferred(self):
+        ran = False
+        while len(self.deferred) > 0:
+            # the deferred nodes run in separate executions, which can defer their successors
+            deferred, self.deferred = self.deferred, {}
+            for node, inps in deferred.items():
+                if node in self.flow.node_successors:
+                    self.update_node_inputs(node, inps)
+            ran = True
+        return ran
+
     # Node.input() =>
     #   DataFlowNative.input(node, index)
 
     # Node.set_output_val() =>
     def set_output_val(self, node, index, data):
         out = node.outputs[index]
+        if output_unchanged(out, data):
+            # early cutoff: the output is not stamped, so propagate_output()
+            # only decreases the wait counts of the successors
+            out.val = data
+            return
 
         if self.execution_root_node is None:  # execution starter!
             self.start_execution(root_output=out)
 
             out.val = data
-            self.output_updated[out] = True
+            self.output_updated[out] = self.execution_epoch
             self.propagate_output(out)
+            self.propagate_ready_nodes()
 
             self.stop_execution()
 
         else:
 
-            if not self.node_waiting[out.node]:
+            if out.node not in self.plan.nodes or out not in self.plan.outputs[out.node]:
                 # the output's node might not be part of the analyzed graph!
+                # (or the output is not, because of the declared dependencies)
                 # in this case we immediately push the value
                 # there are other possible solutions to this, including running
                 # a new execution analysis of this graph here
@@ -186,7 +550,7 @@ class DataFlowOptimized(DataFlowNaive):
 
             else:
                 out.val = data
-                self.output_updated[out] = True
+                self.output_updated[out] = self.execution_epoch
 
     # Node.exec_output() =>
     def exec_output(self, node, index):
@@ -197,13 +561,25 @@ class DataFlowOptimized(DataFlowNaive):
         if self.execution_root_node is None:  # execution starter!
             self.start_execution(root_output=out)
 
-            self.output_updated[out] = True
+            self.output_updated[out] = self.execution_epoch
             self.propagate_output(out)
+            self.propagate_ready_nodes()
 
             self.stop_execution()
 
         else:
-            self.output_updated[out] = True
+            self.output_updated[out] = self.execution_epoch
+
+    # Flow._flow_changed() =>
+    def graph_changed(self, nodes):
+        # the analysis only needs to be repeated for the roots
+        # whose analyzed subgraph contains a changed node
+        self.plan_cache.invalidate(nodes)
+
+        for n in nodes:
+            if n not in self.flow.node_successors:  # removed
+                for out in n.outputs:
+                    self.output_updated.pop(out, None)
 
     """
     
@@ -211,160 +587,2277 @@ class DataFlowOptimized(DataFlowNaive):
     
     """
 
-    def start_execution(self, root_node=None, root_output=None):
+    def start_execution(self, root_node=None, root_output=None, roots=None, root_inp=-1):
 
-        # reset cached output values
-        self.output_updated = {}
-        for n in self.flow.nodes:
-            for out in n.outputs:
-                self.output_updated[out] = False
+        # outputs stamped with an older epoch count as not updated, so
+        # they don't need to be reset, and the cost of starting an execution
+        # only depends on the size of the analyzed subgraph
+        self.execution_epoch += 1
+        self.priorities = self.flow.node_priorities()
 
         if root_node is not None:
             self.execution_root = root_node
             self.execution_root_node = root_node
-            self.waiting_count = self.generate_waiting_count(root_node=root_node)
+            self.waiting_count = self.generate_waiting_count(root_node=root_node, root_inp=root_inp)
 
         elif root_output is not None:
             self.execution_root = root_output
             self.execution_root_node = root_output.node
             self.waiting_count = self.generate_waiting_count(root_output=root_output)
 
+        elif roots is not None:
+            self.execution_root = roots
+            self.execution_root_node = roots[0].node if isinstance(roots[0], NodeOutput) else roots[0]
+            self.waiting_count = self.generate_waiting_count(roots=roots)
+
     def stop_execution(self):
         self.execution_root_node = None
-        self.last_execution_root = self.execution_root
         self.execution_root = None
-
-    def generate_waiting_count(self, root_node=None, root_output=None):
-        if not self.flow_changed and self.execution_root is self.last_execution_root:
-            return self.num_conns_from_predecessors.copy()
-        self.flow_changed = False
-
-        nodes = self.flow.nodes
-        node_successors = self.flow.node_successors
+        self.ready_nodes = []
+        self.joined_inputs = {}
+
+    def generate_waiting_count(self, root_node=None, root_output=None, roots=None, root_inp=-1):
+        if self.flow_changed:
+            self.plan_cache.clear()
+            self.flow_changed = False
+
+        if roots is None:
+            roots = (root_node if root_node is not None else root_output,)
+        # single roots are cached by themselves, combined ones by the tuple
+        root = roots[0] if len(roots) == 1 else roots
+        if root_inp != -1 and root_node is not None and root_node.output_dependencies is not None:
+            # the analysis depends on the updated input
+            root = (root_node, root_inp)
+
+        plan = self.plan_cache.get(root)
+        if plan is None:
+            plan = self.generate_plan(roots=roots, root_inp=root_inp)
+            root_nodes = {r.node if isinstance(r, NodeOutput) else r for r in roots}
+            self.plan_cache.put(root, plan, root_nodes | plan.nodes)
+
+        self.plan = plan
+        return plan.num_conns_from_predecessors.copy()
+
+    def generate_plan(self, root_node=None, root_output=None, roots=None, root_inp=-1) -> ExecutionPlan:
+        if roots is None:
+            roots = (root_node if root_node is not None else root_output,)
 
         # DP TABLE
-        self.num_conns_from_predecessors = {
-            n: 0
-            for n in nodes
-        }
-
-        successors = set()
-        visited = {
-            n: False
-            for n in nodes
-        }
+        num_conns_from_predecessors: Dict[Node, int] = {}
+        affected_outputs: Dict[Node, Set[NodeOutput]] = {}
+
+        # (node, index of an input which can receive data)
+        reached: List[Tuple[Node, int]] = []
+        visited: Set[Node] = set()
+
+        def add_output(out):
+            outs = affected_outputs.setdefault(out.node, set())
+            if out in outs:
+                return
+            outs.add(out)
+            for inp in self.graph[out]:
+                connected_node = inp.node
+                num_conns_from_predecessors[connected_node] = \
+                    num_conns_from_predecessors.get(connected_node, 0) + 1
+                reached.append((connected_node, connected_node.inputs.index(inp)))
 
         # BC
-        if root_node is not None:
-            successors.add(root_node)
-
-        elif root_output is not None:
-            for inp in self.graph[root_output]:
-                connected_node = inp.node
-                self.num_conns_from_predecessors[connected_node] += 1
-                successors.add(connected_node)
+        for root in roots:
+            if isinstance(root, NodeOutput):
+                add_output(root)
+            else:
+                reached.append((root, root_inp if len(roots) == 1 else -1))
 
         # ITERATION
-        while len(successors) > 0:
-            n = successors.pop()
-            if visited[n]:
-                continue
-
-            for s in node_successors[n]:
-                self.num_conns_from_predecessors[s] += 1
-                successors.add(s)
-            visited[n] = True
-
-        self.node_waiting = visited
+        # an output becomes part of the analysis once any input it depends on can receive
+        # data, the iteration ends when no further outputs are affected
+        while len(reached) > 0:
+            n, index = reached.pop()
+            visited.add(n)
+            for out in n.dependent_outputs(index):
+                add_output(out)
+
+        outputs = {
+            n: [out for out in n.outputs if out in outs]
+            for n, outs in affected_outputs.items()
+        }
+        for n in visited:
+            outputs.setdefault(n, [])
 
-        return self.num_conns_from_predecessors.copy()
+        priorities = self.flow.node_priorities()
+        successors = {}
+        for outs in outputs.values():
+            for out in outs:
+                inps = self.graph[out]
+                if len({priorities[inp.node] for inp in inps}) > 1:
+                    successors[out] = sorted(inps, key=lambda inp: -priorities[inp.node])
 
-    def invoke_node_update_event(self, node, inp):
-        super().update_node(node, inp)
+        return ExecutionPlan(visited, num_conns_from_predecessors, outputs, successors)
 
     def decrease_wait(self, node):
         """decreases the wait count of the node;
         if the count reaches zero, which means there is no other input waiting for data,
-        the output values get propagated"""
+        the output values can be propagated"""
 
         self.waiting_count[node] -= 1
         if self.waiting_count[node] == 0:
+            self.push_ready(node)
+
+    def push_ready(self, node):
+        heapq.heappush(self.ready_nodes, (-self.priorities.get(node, 0), -next(self.ready_count), node))
+
+    def pop_ready(self) -> Node:
+        return heapq.heappop(self.ready_nodes)[2]
+
+    def defer(self, node, inps: List[int]) -> bool:
+        """defers the update events of the node if its priority is below defer_below"""
+
+        if self.defer_below is None or self.priorities.get(node, 0) >= self.defer_below:
+            return False
+        self.deferred.setdefault(node, []).extend(inps)
+        return True
+
+    def root_waits(self, node):
+        """whether a root node of a combined execution is reachable from another root,
+        so it only gets updated once its inputs have settled"""
+        return node in self.plan.nodes and self.waiting_count.get(node, 0) > 0
+
+    def propagate_roots(self, roots):
+        """
+        Propagates the roots of a combined execution after the root nodes have been updated:
+        the outputs of root nodes which don't wait for other roots, and the root outputs.
+        """
+
+        for root in roots:
+            if isinstance(root, NodeOutput):
+                self.output_updated[root] = self.execution_epoch
+
+        # determine the ready nodes before anything is propagated
+        ready = []
+        outputs = []
+        for root in roots:
+            node = root.node if isinstance(root, NodeOutput) else root
+            if node in self.plan.nodes:
+                # the root's outputs get propagated with its node
+                if self.waiting_count.get(node, 0) == 0 and node not in ready:
+                    ready.append(node)
+            else:
+                # an output of a node which is not part of the analysis
+                outputs.append(root)
+
+        for out in outputs:
+            self.propagate_output(out)
+        for node in ready:
+            self.propagate_outputs(node)
+
+    def propagate_ready_nodes(self):
+        """propagates the outputs of ready nodes until there are none left;
+        this keeps the propagation iterative instead of recursing through the graph"""
+
+        while len(self.ready_nodes) > 0:
+            node = self.pop_ready()
+            inps = self.joined_inputs.pop(node, None)
+            if inps is not None and not self.defer(node, inps):
+                # all inputs of the join node have settled
+                self.update_node_inputs(node, inps)
             self.propagate_outputs(node)
 
     def propagate_outputs(self, node):
-        """propagates all outputs of node"""
+        """propagates all outputs of node which are part of the execution"""
 
-        for out in node.outputs:
+        for out in self.plan.outputs[node]:
             self.propagate_output(out)
 
     def propagate_output(self, out):
         """pushes an output's value to successors if it has been changed in the execution"""
 
-        if self.output_updated[out]:
+        if self.output_updated.get(out) == self.execution_epoch:
             # same procedure for data and exec connections
-            for inp in self.graph[out]:
-                inp.node.update(inp=inp.node.inputs.index(inp))
+            for inp in self.plan.successors.get(out, self.graph[out]):
+                index = inp.node.inputs.index(inp)
+                if inp.node.join_inputs or inp.node in self.joined_inputs:
+                    # updated once the node is ready
+                    self.add_pending_input(inp.node, index)
+                elif not self.defer(inp.node, [index]):
+                    self.update_successor(inp.node, index)
 
         # decrease wait count of successors
         for inp in self.graph[out]:
             self.decrease_wait(inp.node)
 
+    def update_successor(self, node, inp):
+        """updates a successor whose input received data"""
+        node.update(inp=inp)
 
-class ExecFlowNaive(FlowExecutor):
+    def add_pending_input(self, node, inp):
+        """records an input which received data, for an update once the node is ready"""
+        self.joined_inputs.setdefault(node, []).append(inp)
+
+
+class MemoCache(PlanCache):
     """
-    ...
+    The bounded LRU cache of ``DataFlowMemo``, which maps the fingerprints of a pure
+    node's inputs and state to the outputs its update event set. Entries are
+    invalidated once the graph changes at their node.
     """
 
-    def __init__(self, flow):
-        super().__init__(flow)
 
-        # all the nodes currently updating because of an output data request
-        # used to prevent redundant predecessor updates during the update
-        # of a single successor
-        self.updated_nodes = None
+class DataFlowMemo(DataFlowOptimized):
+    """
+    *(see also documentation in Flow)*
 
-    # Node.update() = >
-    def update_node(self, node, inp):
-        if inp != -1 and node.inputs[inp].type_ == 'data':
-            return
+    An extension of ``DataFlowOptimized`` which memoizes the update events of pure
+    nodes (see ``Node.pure``). Before a pure node's update event is invoked, the
+    executor builds a key from the input index, the fingerprints of the node's input
+    data (``Data.fingerprint()``) and of its state (``Node.get_state()``). If the key
+    is found in the ``MemoCache`` of ``memo_cache_size`` entries, the output values
+    recorded for it are set again, without invoking the update event. Otherwise, the
+    update event is invoked and the outputs it set are recorded.
+
+    Since the successors receive the same data again, they usually hit the cache as
+    well, so re-triggering a node whose results didn't change only re-sets the
+    cached outputs downstream.
+    Update events which raise an exception are not recorded, and nodes whose state
+    cannot be pickled are not memoized.
+
+    With ``eliminate_duplicates``, the executor also shares the update events of pure
+    nodes which are duplicates of each other (see ``Flow.duplicate_nodes()``) within a
+    flow execution. Once one of them has been updated, the others with the same state
+    receiving the same input ``Data`` objects set the recorded outputs, so all of them
+    share the same ``Data`` objects (see the notes on sharing data in ``Data``).
+    This does not need any fingerprints of the input data; set ``memo_cache_size``
+    to 0 to only eliminate duplicates.
+    """
 
-        execution_starter = self.updated_nodes is None
+    def __init__(self, flow, memo_cache_size: int = 256, plan_cache_size: int = 32,
+                 eliminate_duplicates: bool = False):
+        super().__init__(flow, plan_cache_size)
 
-        if execution_starter:
-            self.updated_nodes = {node}
-        else:
-            self.updated_nodes.add(node)
+        self.memo_cache = MemoCache(memo_cache_size)
+        self.eliminate_duplicates = eliminate_duplicates
+        # the outputs set by the update events of pure nodes currently being recorded
+        self.recordings: Dict[Node, List[Tuple[int, Optional[Data]]]] = {}
+        # the outputs recorded for the duplicate nodes in the current execution
+        self.shared_outputs: Dict[Tuple, List[Tuple[int, Optional[Data]]]] = {}
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        if node in self.recordings:
+            self.recordings[node].append((index, data))
+        super().set_output_val(node, index, data)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        if node in self.recordings:
+            self.recordings[node].append((index, None))
+        super().exec_output(node, index)
+
+    # Flow._flow_changed() =>
+    def graph_changed(self, nodes):
+        super().graph_changed(nodes)
+        self.memo_cache.invalidate(nodes)
+
+    """
+
+    Helper methods
+
+    """
+
+    def stop_execution(self):
+        super().stop_execution()
+        self.shared_outputs = {}
 
+    def invoke_node_update_event(self, node, inp):
+        if not node.pure or node in self.recordings:
+            return super().invoke_node_update_event(node, inp)
+
+        state = fingerprint(node.get_state())
+        if state is None:
+            return super().invoke_node_update_event(node, inp)
+
+        shared_key = None
+        if self.eliminate_duplicates:
+            shared_key = self.shared_key(node, inp, state)
+            outputs = self.shared_outputs.get(shared_key)
+            if outputs is not None:
+                self.replay(node, outputs)
+                return
+
+        key = None
+        if self.memo_cache.capacity > 0:
+            key = self.memo_key(node, inp, state)
+            outputs = self.memo_cache.get(key)
+            if outputs is not None:
+                self.replay(node, outputs)
+                if shared_key is not None:
+                    self.shared_outputs[shared_key] = outputs
+                return
+
+        self.recordings[node] = []
         try:
             node.update_event(inp)
         except Exception as e:
             node.update_err(e)
+        else:
+            outputs = self.recordings[node]
+            if key is not None:
+                self.memo_cache.put(key, outputs, {node})
+            if shared_key is not None:
+                self.shared_outputs[shared_key] = outputs
+        finally:
+            del self.recordings[node]
+
+    def replay(self, node, outputs):
+        """sets the recorded outputs of an update event on node"""
+
+        for index, data in outputs:
+            if data is None:
+                self.exec_output(node, index)
+            else:
+                self.set_output_val(node, index, data)
 
-        if execution_starter:
-            self.updated_nodes = None
+    def memo_key(self, node, inp, state: bytes) -> Tuple:
+        """builds the cache key of an update event of a pure node"""
 
-    # Node.input() =>
-    def input(self, node, index):
-        inp = node.inputs[index]
-        out = self.graph_rev[inp]
-        if out:
-            n = out.node
-            if n not in self.updated_nodes:
-                n.update(-1)
+        inputs: List[Optional[Tuple]] = []
+        for i, node_inp in enumerate(node.inputs):
+            if node_inp.type_ != 'data':
+                inputs.append(None)
+                continue
+            data = self.input(node, i)
+            inputs.append(data.fingerprint() if data is not None else None)
 
-            return out.val
+        return node, inp, tuple(inputs), state
+
+    def shared_key(self, node, inp, state: bytes) -> Tuple:
+        """builds the key under which the duplicates of a pure node share an update
+        event in the current execution; connected inputs are compared by identity"""
+
+        inputs: List[Any] = []
+        for i, node_inp in enumerate(node.inputs):
+            if node_inp.type_ != 'data':
+                inputs.append(None)
+                continue
+            data = self.input(node, i)
+            if data is not None and self.flow.graph_adj_rev[node_inp] is None:
+                data = data.fingerprint()
+            inputs.append(data)
+
+        rep = self.flow.duplicate_nodes().get(node, node)
+        return rep, inp, tuple(inputs), state
+
+
+class DataFlowSliced(DataFlowOptimized):
+    """
+    *(see also documentation in Flow)*
+
+    An extension of ``DataFlowOptimized`` which runs executions in resumable slices,
+    so a host application's event loop is not blocked until the whole propagation
+    has finished. Updates and output values set from outside only get queued;
+    ``Flow.run_slice()`` then works on the queued executions one after another for
+    a time budget of ``slice_budget`` seconds, and returns control to the caller,
+    which calls it again to resume where it left off. No threads are involved.
+
+    Instead of updating the successors of an output right away, the executor keeps
+    the pending update events of the running execution in a queue, next to the
+    ready nodes, so the whole execution state can be suspended between any two
+    update events. Single update events are never interrupted, so a slice can take
+    longer than its budget. Each queued update or output value runs in its own
+    execution, with the same guarantees as in ``DataFlowOptimized``.
+    """
+
+    def __init__(self, flow, slice_budget: float = 0.005, plan_cache_size: int = 32):
+        super().__init__(flow, plan_cache_size)
+
+        self.slice_budget = slice_budget
+        # the roots of the executions to run, (node, inp, None) or (output, -1, data)
+        self.queued: deque = deque()
+        # the update events of the running execution which are still to be invoked
+        self.updates: deque = deque()
+        self.in_slice = False
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        if self.in_slice:
+            self.invoke_node_update_event(node, inp)
         else:
-            return None
+            self.queued.append((node, inp, None))
+
+    # Flow.update_many() =>
+    def update_many(self, roots):
+        # every root is queued on its own
+        FlowExecutor.update_many(self, roots)
 
     # Node.set_output_val() =>
     def set_output_val(self, node, index, data):
-        out = node.outputs[index]
-        out.val = data
+        if self.in_slice:
+            super().set_output_val(node, index, data)
+        else:
+            self.queued.append((node.outputs[index], -1, data))
 
     # Node.exec_output() =>
     def exec_output(self, node, index):
-        for inp in self.graph[node.outputs[index]]:
-            inp.node.update(inp.node.inputs.index(inp))
+        if self.in_slice:
+            super().exec_output(node, index)
+        else:
+            self.queued.append((node.outputs[index], -1, None))
+
+    # Flow.run_slice() =>
+    def run_slice(self, budget=None):
+        deadline = time.perf_counter() + (self.slice_budget if budget is None else budget)
+
+        self.in_slice = True
+        try:
+            while self.step():
+                if time.perf_counter() >= deadline:
+                    return self.pending()
+            return False
+        finally:
+            self.in_slice = False
+
+    """
+
+    Helper methods
+
+    """
+
+    def pending(self) -> bool:
+        """whether there is an execution running or queued"""
+        return self.execution_root_node is not None or len(self.queued) > 0
+
+    def stop_execution(self):
+        super().stop_execution()
+        self.updates = deque()
+
+    def step(self) -> bool:
+        """
+        Runs the next unit of work: an update event, the propagation of a ready
+        node, or the start of a queued execution. Returns False if there is none.
+        """
+
+        if len(self.updates) > 0:
+            # the updates of a node are always invoked before it becomes ready
+            node, inp = self.updates.popleft()
+            node.update(inp=inp)
+
+        elif len(self.ready_nodes) > 0:
+            node = self.pop_ready()
+            inps = self.joined_inputs.pop(node, None)
+            if inps is not None and not self.defer(node, inps):
+                self.update_node_inputs(node, inps)
+            self.propagate_outputs(node)
+
+        elif self.execution_root_node is not None:
+            self.stop_execution()
+
+        elif len(self.queued) > 0:
+            self.start_queued(*self.queued.popleft())
+
+        else:
+            return False
+
+        return True
+
+    def start_queued(self, root, inp, data):
+        """starts the execution of a queued update or output value"""
+
+        if isinstance(root, NodeOutput):
+            if root.type_ == 'data':
+                if output_unchanged(root, data):
+                    root.val = data
+                    return
+                self.start_execution(root_output=root)
+                root.val = data
+            else:
+                self.start_execution(root_output=root)
+            self.output_updated[root] = self.execution_epoch
+            self.propagate_output(root)
+
+        else:
+            self.start_execution(root_node=root, root_inp=inp)
+            # Node.update() has been called already when the update was queued
+            self.invoke_node_update_event(root, inp)
+            self.propagate_outputs(root)
+
+    def update_successor(self, node, inp):
+        self.updates.append((node, inp))
+
+
+class DataFlowParallel(DataFlowOptimized):
+    """
+    *(see also documentation in Flow)*
+
+    A data flow executor which runs independent nodes concurrently on a
+    ``concurrent.futures.ThreadPoolExecutor`` of ``max_workers`` threads.
+    It uses the same analysis and wait counts as ``DataFlowOptimized``, but a node's
+    update events are only invoked once all its predecessors in the execution have
+    settled, i.e. once its wait count reaches zero. All update events for the inputs
+    which received data are then invoked consecutively in a worker thread, while the
+    thread that started the execution submits ready nodes and propagates the outputs
+    of finished ones, until all nodes have settled.
+
+    The events of the nodes are always emitted in the thread that started the
+    execution: ``Node.updating`` right before the node's update events are submitted
+    to the pool, and ``Node.update_error`` once they have finished.
+
+    This only results in actual parallelism if the update events release the GIL,
+    e.g. in NumPy operations or I/O.
+
+    Assumptions for the graph:
+    - no feedback loops / cycles in the graph
+    - nodes never modify their ports (inputs, outputs) during execution
+    - nodes running in parallel don't access shared state unsynchronized
+    """
+
+    def __init__(self, flow, max_workers: Optional[int] = None, plan_cache_size: int = 32):
+        super().__init__(flow, plan_cache_size)
+
+        self.max_workers = max_workers
+        self.pool: Optional[ThreadPoolExecutor] = None
+
+        self.pending_inputs: Dict[Node, List[int]] = {}
+        self._coordinator: Optional[int] = None       # ident of the thread running the execution
+        self._collected_inputs: Optional[List[int]] = None
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        if self.execution_root_node is None:  # execution starter!
+            self.start_execution(root_node=node, root_inp=inp)
+            self.invoke_node_update_event(node, inp)
+            self.propagate_outputs(node)
+            self.run_ready_nodes()
+            self.stop_execution()
+
+        elif self._collected_inputs is not None and threading.get_ident() == self._coordinator:
+            # called from run_ready_nodes(), the update event gets submitted to the pool
+            self._collected_inputs.append(inp)
+
+        else:
+            self.invoke_node_update_event(node, inp)
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        if self.execution_root_node is None:  # execution starter!
+            out = node.outputs[index]
+            if output_unchanged(out, data):
+                out.val = data
+                return
+            self.start_execution(root_output=out)
+
+            out.val = data
+            self.output_updated[out] = self.execution_epoch
+            self.propagate_output(out)
+            self.run_ready_nodes()
+
+            self.stop_execution()
+
+        else:
+            super().set_output_val(node, index, data)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        if self.execution_root_node is None:  # execution starter!
+            out = node.outputs[index]
+            self.start_execution(root_output=out)
+
+            self.output_updated[out] = self.execution_epoch
+            self.propagate_output(out)
+            self.run_ready_nodes()
+
+            self.stop_execution()
+
+        else:
+            super().exec_output(node, index)
+
+    # Flow.set_algorithm_mode() =>
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    """
+
+    Helper methods
+
+    """
+
+    def stop_execution(self):
+        super().stop_execution()
+        self.pending_inputs = {}
+
+    def propagate_ready_nodes(self):
+        self.run_ready_nodes()
+
+    def add_pending_input(self, node, inp):
+        self.pending_inputs.setdefault(node, []).append(inp)
+
+    def propagate_output(self, out):
+        """marks the connected inputs as pending if the output has been updated"""
+
+        if self.output_updated.get(out) == self.execution_epoch:
+            pending_inputs = self.pending_inputs
+            for inp in self.graph[out]:
+                index = inp.node.inputs.index(inp)
+                if inp.node in pending_inputs:
+                    pending_inputs[inp.node].append(index)
+                else:
+                    pending_inputs[inp.node] = [index]
+
+        # decrease wait count of successors
+        for inp in self.graph[out]:
+            self.decrease_wait(inp.node)
+
+    def run_ready_nodes(self):
+        """submits ready nodes to the pool and settles finished ones until all are done"""
+
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix='ryvencore')
+
+        running: Dict[Future, Node] = {}
+        self._coordinator = threading.get_ident()
+        try:
+            while len(self.ready_nodes) > 0 or len(running) > 0:
+
+                job = self.next_ready_node()
+                while job is not None:
+                    running[self.submit_node(*job)] = job[0]
+                    job = self.next_ready_node()
+
+                if len(running) > 0:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node = running.pop(future)
+                        next_future = self.finish_node(node, future)
+                        if next_future is not None:
+                            running[next_future] = node
+                        else:
+                            self.propagate_outputs(node)
+        finally:
+            self._coordinator = None
+            self._collected_inputs = None
+
+    def next_ready_node(self) -> Optional[Tuple[Node, List[int]]]:
+        """
+        Pops ready nodes until one has update events to run, and returns it together
+        with the inputs. Ready nodes without any are settled right away.
+        """
+
+        while len(self.ready_nodes) > 0:
+            node = self.pop_ready()
+            inps = self.pending_inputs.pop(node, None)
+            if inps is None:
+                # no input received data
+                self.propagate_outputs(node)
+                continue
+
+            # emit the node's events here, see update_node()
+            self._collected_inputs = []
+            self.update_node_inputs(node, inps)
+            inps, self._collected_inputs = self._collected_inputs, None
+
+            if len(inps) == 0:
+                # updates are blocked
+                self.propagate_outputs(node)
+                continue
+
+            return node, inps
+
+        return None
+
+    def submit_node(self, node: Node, inps: List[int]) -> Future:
+        """submits the node's update events to the pool"""
+
+        assert self.pool is not None, 'the pool is created by run_ready_nodes()'
+        return self.pool.submit(self.run_node, node, inps)
+
+    def finish_node(self, node: Node, future: Future) -> Optional[Future]:
+        """
+        Processes the result of a submitted node. Returns a new future
+        if the node is not finished yet.
+        """
+
+        for e in future.result():
+            self.report_error(node, e)
+        return None
+
+    @staticmethod
+    def run_node(node: Node, inps: List[int]) -> List[Exception]:
+        """invokes the node's update events; runs in a worker thread"""
+
+        errors = []
+        for inp in inps:
+            try:
+                node.update_event(inp)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    @staticmethod
+    def report_error(node: Node, e: Exception):
+        """emits the node's update error with the exception's original traceback"""
+
+        try:
+            raise e
+        except Exception as e:
+            node.update_err(e)
+
+
+"""
+The following is executed in the worker processes of DataFlowMultiProcess.
+A worker keeps an instance of every node class it ran, whose inputs and
+outputs are redirected to the data shipped with the job.
+"""
+
+_worker_nodes: OrderedDict = OrderedDict()     # node id -> (spec key, node)
+_WORKER_CACHE_SIZE = 1024
+
+
+class _WorkerExecutor:
+    """stands in for the executor of nodes running in a worker process"""
+
+    def __init__(self):
+        self.inputs: List[Optional[Data]] = []
+        self.outputs: Dict[int, Optional[Data]] = {}
+
+    def update_node(self, node, inp):
+        node.update_event(inp)
+
+    def input(self, node, index):
+        return self.inputs[index]
+
+    def set_output_val(self, node, index, data):
+        self.outputs[index] = data
+
+    def exec_output(self, node, index):
+        self.outputs[index] = None
+
+
+class _WorkerFlow:
+    """stands in for the flow of nodes running in a worker process"""
+
+    def __init__(self):
+        self.executor = _WorkerExecutor()
+
+
+def _pack_data(data: Optional[Data]):
+    return None if data is None else (type(data), data.get_data())
+
+
+def _unpack_data(packed) -> Optional[Data]:
+    if packed is None:
+        return None
+    data_class, payload = packed
+    data = data_class()
+    data.set_data(payload)
+    return data
+
+
+def _run_in_worker(
+        node_class,
+        node_id: int,
+        spec_key: int,
+        spec: Optional[Dict],
+        inputs: List,
+        inps: List[int],
+        updated_inputs: List[int],
+):
+    """
+    Runs the update events of a node in a worker process. Returns None if the
+    node is not cached in the worker and ``spec`` was not sent, otherwise the
+    updated outputs and the exceptions raised.
+    """
+
+    entry = _worker_nodes.get(node_id)
+    if entry is not None and entry[0] == spec_key:
+        node = entry[1]
+        _worker_nodes.move_to_end(node_id)
+    elif spec is None:
+        return None
+    else:
+        node = node_class((_WorkerFlow(), None))
+        for label, type_ in spec['inputs']:
+            node.create_input(label=label, type_=type_)
+        for label, type_ in spec['outputs']:
+            node.create_output(label=label, type_=type_)
+        node.set_state(deserialize(spec['state']), spec['version'])
+
+        _worker_nodes[node_id] = (spec_key, node)
+        if len(_worker_nodes) > _WORKER_CACHE_SIZE:
+            _worker_nodes.popitem(last=False)
+
+    executor = node.flow.executor
+    executor.inputs = [_unpack_data(d) for d in inputs]
+    executor.outputs = {}
+    node.updated_inputs = updated_inputs
+
+    errors = []
+    for inp in inps:
+        try:
+            node.update_event(inp)
+        except Exception as e:
+            errors.append(e)
+
+    outputs = [(index, _pack_data(data)) for index, data in executor.outputs.items()]
+    return outputs, errors
+
+
+class DataFlowMultiProcess(DataFlowParallel):
+    """
+    *(see also documentation in Flow)*
+
+    Extends ``DataFlowParallel`` by running the update events of nodes with
+    ``Node.run_in_process`` set in a ``concurrent.futures.ProcessPoolExecutor`` of
+    ``max_processes`` processes, which is kept alive between executions.
+    All other nodes run in the thread pool.
+
+    The input data is transported to the worker using ``Data.get_data()`` and
+    ``Data.set_data()``, and so are the output values, which are set on the
+    node in the main process once it finished. A worker process keeps its own
+    instance of every node it ran, which is only rebuilt if the node's
+    ports or ``get_state()`` changed, so nodes are never pickled.
+    Hence, the node classes and the ``Data`` classes they use must be importable
+    by the worker processes, and the nodes' update events can only access
+    their inputs, outputs, and state, but not the flow, session, or add-ons.
+    """
+
+    def __init__(
+            self,
+            flow,
+            max_processes: Optional[int] = None,
+            max_workers: Optional[int] = None,
+            plan_cache_size: int = 32,
+    ):
+        super().__init__(flow, max_workers, plan_cache_size)
+
+        self.max_processes = max_processes
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[Future, Tuple] = {}    # future -> job arguments, in case the worker needs the spec
+
+    # Flow.set_algorithm_mode() =>
+    def shutdown(self):
+        super().shutdown()
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+            self.process_pool = None
+
+    """
+
+    Helper methods
+
+    """
+
+    def submit_node(self, node, inps):
+        if not node.run_in_process:
+            return super().submit_node(node, inps)
+
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(self.max_processes)
+
+        spec = {
+            'inputs': [(i.label_str, i.type_) for i in node.inputs],
+            'outputs': [(o.label_str, o.type_) for o in node.outputs],
+            'state': serialize(node.get_state()),
+            'version': node.version,
+        }
+        spec_key = hash((tuple(spec['inputs']), tuple(spec['outputs']), spec['state']))
+        inputs = [_pack_data(node.input(i)) for i in range(len(node.inputs))]
+
+        job = (type(node), node.global_id, spec_key, spec, inputs, inps, node.updated_inputs)
+        # the spec is only sent again if the worker doesn't have the node
+        future = self.process_pool.submit(_run_in_worker, *job[:3], None, *job[4:])
+        self._jobs[future] = job
+        return future
+
+    def finish_node(self, node, future):
+        if not node.run_in_process:
+            return super().finish_node(node, future)
+
+        job = self._jobs.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            # e.g. pickling errors
+            self.report_error(node, e)
+            return None
+
+        if result is None:
+            # the worker doesn't have the node yet
+            next_future = self.process_pool.submit(_run_in_worker, *job)
+            self._jobs[next_future] = job
+            return next_future
+
+        outputs, errors = result
+        for index, packed in outputs:
+            if packed is None:
+                node.exec_output(index)
+            else:
+                node.set_output_val(index, _unpack_data(packed))
+        for error in errors:
+            self.report_error(node, error)
+
+        return None
+
+
+class DataFlowAsync(DataFlowParallel):
+    """
+    *(see also documentation in Flow)*
+
+    A data flow executor running on an asyncio event loop, where the nodes'
+    ``update_event()`` can be coroutine functions (``async def``).
+    It works like ``DataFlowParallel``, but instead of a thread pool, every node
+    whose predecessors have settled is run as a task on the event loop, and
+    at most ``max_concurrency`` nodes run at the same time. Nodes waiting for I/O
+    therefore overlap, while regular update events run directly in the loop.
+
+    Executions are awaited through ``Node.update_async()`` or ``Flow.run_async()``,
+    and run one after another. A synchronous ``Node.update()`` or
+    ``Node.set_output_val()`` starting a new execution schedules it on the
+    running event loop, or runs it to completion if there is none.
+
+    Inside an execution, a synchronous ``Node.update()`` call on a node with a
+    coroutine update event is not awaited by the execution.
+    """
+
+    def __init__(self, flow, max_concurrency: Optional[int] = None, plan_cache_size: int = 32):
+        super().__init__(flow, plan_cache_size=plan_cache_size)
+
+        self.max_concurrency = max_concurrency
+
+        # set inside executions, and inherited by the tasks they start
+        self._in_execution: ContextVar[bool] = ContextVar('in_execution', default=False)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._execution_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._scheduled: Set[asyncio.Task] = set()
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        if not self._in_execution.get():  # execution starter!
+            self.run_coroutine(self.update_node_async(node, inp))
+
+        elif self._collected_inputs is not None:
+            # called from next_ready_node(), the update event gets run as a task
+            self._collected_inputs.append(inp)
+
+        else:
+            self.invoke_node_update_event(node, inp)
+
+    # Node.update_async() =>
+    async def update_node_async(self, node, inp=-1):
+        if self._in_execution.get():
+            # awaited by a node inside the execution
+            await self.invoke_node_update_event_async(node, inp)
+            return
+
+        async with self.execution_lock():
+            token = self._in_execution.set(True)
+            self.start_execution(root_node=node, root_inp=inp)
+            try:
+                await self.invoke_node_update_event_async(node, inp)
+                self.propagate_outputs(node)
+                await self.run_ready_nodes_async()
+            finally:
+                self.stop_execution()
+                self._in_execution.reset(token)
+
+    # Flow.update_many() =>
+    def update_many(self, roots):
+        if not self._in_execution.get():  # execution starter!
+            self.run_coroutine(self.update_many_async(roots))
+        else:
+            super().update_many(roots)
+
+    # Flow.run_async() =>
+    async def update_many_async(self, roots):
+        if self._in_execution.get():
+            # awaited by a node inside the execution
+            super().update_many(roots)
+            return
+
+        roots = tuple(dict.fromkeys(roots))
+        if len(roots) == 0:
+            return
+        async with self.execution_lock():
+            token = self._in_execution.set(True)
+            self.start_execution(roots=roots)
+            try:
+                for root in roots:
+                    if isinstance(root, NodeOutput):
+                        continue
+                    if self.root_waits(root):
+                        self.add_pending_input(root, -1)
+                    else:
+                        await root.update_async()
+                self.propagate_roots(roots)
+                await self.run_ready_nodes_async()
+            finally:
+                self.stop_execution()
+                self._in_execution.reset(token)
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        if not self._in_execution.get():  # execution starter!
+            if output_unchanged(node.outputs[index], data):
+                node.outputs[index].val = data
+                return
+            self.run_coroutine(self.propagate_root_output_async(node.outputs[index], data))
+        else:
+            DataFlowOptimized.set_output_val(self, node, index, data)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        if not self._in_execution.get():  # execution starter!
+            self.run_coroutine(self.propagate_root_output_async(node.outputs[index]))
+        else:
+            DataFlowOptimized.exec_output(self, node, index)
+
+    # Flow.set_algorithm_mode() =>
+    def shutdown(self):
+        for task in self._scheduled:
+            task.cancel()
+        super().shutdown()
+
+    """
+
+    Helper methods
+
+    """
+
+    async def propagate_root_output_async(self, out, data=None):
+        """executes the flow from an output; sets the value for data outputs"""
+
+        async with self.execution_lock():
+            token = self._in_execution.set(True)
+            self.start_execution(root_output=out)
+            try:
+                if out.type_ == 'data':
+                    out.val = data
+                self.output_updated[out] = self.execution_epoch
+                self.propagate_output(out)
+                await self.run_ready_nodes_async()
+            finally:
+                self.stop_execution()
+                self._in_execution.reset(token)
+
+    def run_coroutine(self, coro):
+        """schedules the coroutine on the running event loop, or runs it to completion"""
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coro)
+            return
+
+        task = loop.create_task(coro)
+        self._scheduled.add(task)
+        task.add_done_callback(self._scheduled.discard)
+
+    def execution_lock(self) -> asyncio.Lock:
+        """returns the lock serializing the executions on the running loop"""
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # asyncio primitives are bound to a loop
+            self._loop = loop
+            self._execution_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency) \
+                if self.max_concurrency is not None else None
+        assert self._execution_lock is not None
+        return self._execution_lock
+
+    def invoke_node_update_event(self, node, inp):
+        try:
+            result = node.update_event(inp)
+            if inspect.isawaitable(result):
+                # cannot be awaited here
+                task = asyncio.ensure_future(result)
+                task.add_done_callback(
+                    lambda t: t.cancelled() or t.exception() is None
+                    or self.report_error(node, t.exception()))
+        except Exception as e:
+            node.update_err(e)
+
+    async def invoke_node_update_event_async(self, node, inp):
+        errors = await self.run_node_async(node, [inp])
+        for e in errors:
+            self.report_error(node, e)
+
+    async def run_node_async(self, node: Node, inps: List[int]) -> List[Exception]:
+        """invokes and awaits the node's update events"""
+
+        if self._semaphore is not None:
+            async with self._semaphore:
+                return await self.run_node_events_async(node, inps)
+        return await self.run_node_events_async(node, inps)
+
+    @staticmethod
+    async def run_node_events_async(node: Node, inps: List[int]) -> List[Exception]:
+        errors = []
+        for inp in inps:
+            try:
+                result = node.update_event(inp)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    async def run_ready_nodes_async(self):
+        """starts tasks for ready nodes and settles finished ones until all are done"""
+
+        running: Dict[asyncio.Task, Node] = {}
+        while len(self.ready_nodes) > 0 or len(running) > 0:
+
+            job = self.next_ready_node()
+            while job is not None:
+                node, inps = job
+                running[asyncio.ensure_future(self.run_node_async(node, inps))] = node
+                job = self.next_ready_node()
+
+            if len(running) > 0:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = running.pop(task)
+                    for e in task.result():
+                        self.report_error(node, e)
+                    self.propagate_outputs(node)
+
+
+class Schedule:
+    """
+    A compiled execution plan of ``DataFlowScheduled``: the flat, levelized list of
+    nodes reachable from an execution root, and the flat ``(successor, input index)``
+    edge lists of their outputs.
+    """
+
+    def __init__(self, nodes: List[Node], out_edges: Dict[NodeOutput, List[Tuple[Node, int]]]):
+        self.nodes = nodes
+        self.node_set = set(nodes)
+        self.out_edges = out_edges
+
+
+class DataFlowScheduled(DataFlowNaive):
+    """
+    *(see also documentation in Flow)*
+
+    A data flow executor for mostly static graphs. Based on the topological levels
+    which the flow maintains for its nodes, it compiles a *levelized topological
+    schedule* for every execution root: the flat list of all nodes reachable from
+    the root, ordered by level, together with flat ``(successor, input index)`` edge
+    lists for their outputs (see ``Schedule``).
+
+    An execution does not recurse through the successors. Instead, it walks the
+    schedule and invokes the update events of every node that received input data,
+    in schedule order. Since all predecessors of a node come before it in the
+    schedule, every output is propagated only once per execution, like in
+    ``DataFlowOptimized``, but without any per-execution graph analysis.
+    The schedules are kept in a ``PlanCache`` of ``plan_cache_size`` schedules.
+    ``Flow.update_many()`` walks a combined schedule for all roots, where the root
+    nodes are updated in schedule order, once, even if their inputs received data.
+
+    Assumptions for the graph:
+    - no feedback loops / cycles in the graph
+    - nodes never modify their ports (inputs, outputs) during execution
+    """
+
+    def __init__(self, flow, plan_cache_size: int = 32):
+        super().__init__(flow)
+
+        self.plan_cache = PlanCache(plan_cache_size)
+
+        # execution state
+        self.schedule: Optional[Schedule] = None
+        self.output_updated: Set[NodeOutput] = set()
+        self.pending_inputs: Dict[Node, List[int]] = {}
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        if self.schedule is None:  # execution starter!
+            self.start_execution(node)
+            self.invoke_node_update_event(node, inp)
+            self.propagate_outputs(node)
+            self.run_schedule()
+            self.stop_execution()
+        else:
+            self.invoke_node_update_event(node, inp)
+
+    # Flow.update_many() =>
+    def update_many(self, roots):
+        if self.schedule is not None:
+            # inside an execution
+            super().update_many(roots)
+            return
+
+        roots = tuple(dict.fromkeys(roots))
+        if len(roots) == 0:
+            return
+        self.start_execution(roots if len(roots) > 1 else roots[0])
+        for root in roots:
+            if isinstance(root, NodeOutput):
+                self.output_updated.add(root)
+                if root.node in self.schedule.node_set:
+                    # gets propagated with its node
+                    self.pending_inputs.setdefault(root.node, [])
+                else:
+                    self.propagate_output(root)
+            else:
+                # root nodes are updated in schedule order, after their predecessors
+                self.pending_inputs.setdefault(root, []).append(-1)
+        self.run_schedule()
+        self.stop_execution()
+
+    # Node.input() =>
+    #   DataFlowNaive.input(node, index)
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        out = node.outputs[index]
+        if output_unchanged(out, data):
+            out.val = data
+            return
+
+        if self.schedule is None:  # execution starter!
+            self.start_execution(out)
+            out.val = data
+            self.output_updated.add(out)
+            self.propagate_output(out)
+            self.run_schedule()
+            self.stop_execution()
+
+        elif node not in self.schedule.node_set:
+            # the node is not part of the scheduled subgraph, so
+            # we immediately push the value like in DataFlowNaive
+            super().set_output_val(node, index, data)
+
+        else:
+            out.val = data
+            self.output_updated.add(out)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        # rudimentary exec support also in data flows
+
+        out = node.outputs[index]
+
+        if self.schedule is None:  # execution starter!
+            self.start_execution(out)
+            self.output_updated.add(out)
+            self.propagate_output(out)
+            self.run_schedule()
+            self.stop_execution()
+
+        elif node not in self.schedule.node_set:
+            super().exec_output(node, index)
+
+        else:
+            self.output_updated.add(out)
+
+    # Flow._flow_changed() =>
+    def graph_changed(self, nodes):
+        # only the schedules containing the changed nodes are outdated
+        self.plan_cache.invalidate(nodes)
+
+    """
+
+    Helper methods
+
+    """
+
+    def compile_schedule(self, root: Union[Node, NodeOutput, Tuple]) -> Schedule:
+        """slices the levelized subgraph reachable from the root, or the tuple of roots"""
+
+        graph = self.graph
+        node_successors = self.flow.node_successors
+        roots = root if isinstance(root, tuple) else (root,)
+
+        reached: Set[Node] = set()
+        for r in roots:
+            if isinstance(r, NodeOutput):
+                reached.update(inp.node for inp in graph[r])
+            else:
+                reached.add(r)
+
+        stack = list(reached)
+        while len(stack) > 0:
+            n = stack.pop()
+            for s in node_successors[n]:
+                if s not in reached:
+                    reached.add(s)
+                    stack.append(s)
+
+        levels = self.flow.node_levels()
+        if levels is not None:
+            nodes = sorted(reached, key=levels.__getitem__)
+        else:
+            # cycles are not supported, the order is undefined
+            nodes = [n for n in self.flow.nodes if n in reached]
+
+        out_edges = {
+            out: [(inp.node, inp.node.inputs.index(inp)) for inp in graph[out]]
+            for n in nodes
+            for out in n.outputs
+        }
+        for r in roots:
+            if isinstance(r, NodeOutput):
+                out_edges[r] = [(inp.node, inp.node.inputs.index(inp)) for inp in graph[r]]
+
+        return Schedule(nodes, out_edges)
+
+    def start_execution(self, root: Union[Node, NodeOutput, Tuple]):
+        if self.flow_changed:
+            self.plan_cache.clear()
+            self.flow_changed = False
+
+        schedule = self.plan_cache.get(root)
+        if schedule is None:
+            schedule = self.compile_schedule(root)
+            roots = root if isinstance(root, tuple) else (root,)
+            root_nodes = {r.node if isinstance(r, NodeOutput) else r for r in roots}
+            self.plan_cache.put(root, schedule, root_nodes | schedule.node_set)
+
+        self.schedule = schedule
+        self.output_updated = set()
+        self.pending_inputs = {}
+
+    def stop_execution(self):
+        self.schedule = None
+        self.output_updated = set()
+        self.pending_inputs = {}
+
+    def run_schedule(self):
+        """walks the schedule and updates all nodes that received data"""
+
+        pending_inputs = self.pending_inputs
+        for node in self.schedule.nodes:
+            inps = pending_inputs.pop(node, None)
+            if inps is None:
+                continue
+            self.update_node_inputs(node, inps)
+            self.propagate_outputs(node)
+
+    def propagate_outputs(self, node):
+        """propagates all updated outputs of node"""
+
+        for out in node.outputs:
+            self.propagate_output(out)
+
+    def propagate_output(self, out):
+        """marks the connected inputs as pending if the output has been updated"""
+
+        if out not in self.output_updated:
+            return
+
+        pending_inputs = self.pending_inputs
+        for node, index in self.schedule.out_edges[out]:
+            if node in pending_inputs:
+                pending_inputs[node].append(index)
+            else:
+                pending_inputs[node] = [index]
+
+
+class ComponentSchedule:
+    """
+    A compiled execution plan of ``DataFlowFixedPoint``: the strongly connected
+    components of the subgraph reachable from an execution root, in topological
+    order, with the nodes of every component in discovery order.
+    """
+
+    def __init__(self, components: List[List[Node]]):
+        self.components = components
+        self.component_of: Dict[Node, int] = {
+            n: i for i, comp in enumerate(components) for n in comp
+        }
+        self.cyclic: List[bool] = [len(comp) > 1 for comp in components]
+
+
+class DataFlowFixedPoint(DataFlowNaive):
+    """
+    *(see also documentation in Flow)*
+
+    A data flow executor for graphs with feedback loops. For every execution root,
+    it decomposes the reachable subgraph into its strongly connected components
+    (SCCs, see ``ComponentSchedule``), and walks them in topological order. Acyclic
+    components (single nodes) are updated like in ``DataFlowScheduled``, once for
+    every input which received data. The nodes of a cyclic component are updated
+    in sweeps until a fixed point is reached, i.e. until no node of the component
+    has pending inputs left.
+
+    Within a component, an output only causes further updates if its new value
+    didn't converge, as decided by ``converged(old, new)``, which by default compares
+    the data using ``Data.equals()``. A component which doesn't
+    reach a fixed point within ``max_iterations`` sweeps is aborted and reported as
+    an update error of its first node. Once the component is done, the successors
+    outside of it receive the final values.
+
+    Assumptions for the graph:
+    - feedback loops converge, or can be cut off after ``max_iterations`` sweeps
+    - nodes never modify their ports (inputs, outputs) during execution
+    """
+
+    def __init__(
+            self,
+            flow,
+            max_iterations: int = 100,
+            converged: Optional[Callable[[Optional[Data], Optional[Data]], bool]] = None,
+            plan_cache_size: int = 32,
+    ):
+        super().__init__(flow)
+
+        self.max_iterations = max_iterations
+        self.converged = converged if converged is not None else data_equal
+        self.plan_cache = PlanCache(plan_cache_size)
+
+        # execution state
+        self.schedule: Optional[ComponentSchedule] = None
+        self.output_updated: Set[NodeOutput] = set()
+        self.output_changed: Set[NodeOutput] = set()
+        self.pending_inputs: Dict[Node, List[int]] = {}
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        if self.schedule is None:  # execution starter!
+            self.start_execution(node)
+            self.invoke_node_update_event(node, inp)
+            component = self.schedule.component_of[node]
+            for out in node.outputs:
+                self.propagate_output(out, component)
+            self.run_schedule()
+            self.stop_execution()
+        else:
+            self.invoke_node_update_event(node, inp)
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        out = node.outputs[index]
+        if output_unchanged(out, data):
+            out.val = data
+            return
+
+        if self.schedule is None:  # execution starter!
+            self.start_execution(out)
+            out.val = data
+            self.output_updated.add(out)
+            self.propagate_output(out, None)
+            self.run_schedule()
+            self.stop_execution()
+
+        elif node not in self.schedule.component_of:
+            super().set_output_val(node, index, data)
+
+        else:
+            old = out.val
+            out.val = data
+            self.output_updated.add(out)
+            if not self.converged(old, data):
+                self.output_changed.add(out)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        out = node.outputs[index]
+
+        if self.schedule is None:  # execution starter!
+            self.start_execution(out)
+            self.output_updated.add(out)
+            self.propagate_output(out, None)
+            self.run_schedule()
+            self.stop_execution()
+
+        elif node not in self.schedule.component_of:
+            super().exec_output(node, index)
+
+        else:
+            self.output_updated.add(out)
+            self.output_changed.add(out)
+
+    # Flow._flow_changed() =>
+    def graph_changed(self, nodes):
+        self.plan_cache.invalidate(nodes)
+
+    """
+
+    Helper methods
+
+    """
+
+    def compile_schedule(self, root: Union[Node, NodeOutput]) -> ComponentSchedule:
+        """finds the SCCs reachable from the root, using an iterative version of Tarjan's algorithm"""
+
+        node_successors = self.flow.node_successors
+        if isinstance(root, NodeOutput):
+            starts = [inp.node for inp in self.graph[root]]
+        else:
+            starts = [root]
+
+        index: Dict[Node, int] = {}
+        lowlink: Dict[Node, int] = {}
+        on_stack: Set[Node] = set()
+        stack: List[Node] = []
+        components: List[List[Node]] = []
+
+        for start in starts:
+            if start in index:
+                continue
+            index[start] = lowlink[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            call_stack = [(start, iter(node_successors[start]))]
+
+            while len(call_stack) > 0:
+                n, successors = call_stack[-1]
+                for s in successors:
+                    if s not in index:
+                        index[s] = lowlink[s] = len(index)
+                        stack.append(s)
+                        on_stack.add(s)
+                        call_stack.append((s, iter(node_successors[s])))
+                        break
+                    elif s in on_stack:
+                        lowlink[n] = min(lowlink[n], index[s])
+                else:
+                    call_stack.pop()
+                    if len(call_stack) > 0:
+                        parent = call_stack[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[n])
+
+                    if lowlink[n] == index[n]:
+                        # n is the root of a component
+                        comp = []
+                        while True:
+                            m = stack.pop()
+                            on_stack.discard(m)
+                            comp.append(m)
+                            if m is n:
+                                break
+                        comp.sort(key=index.__getitem__)
+                        components.append(comp)
+
+        # Tarjan's algorithm finds the components in reverse topological order
+        components.reverse()
+        return ComponentSchedule(components)
+
+    def start_execution(self, root: Union[Node, NodeOutput]):
+        if self.flow_changed:
+            self.plan_cache.clear()
+            self.flow_changed = False
+
+        schedule = self.plan_cache.get(root)
+        if schedule is None:
+            schedule = self.compile_schedule(root)
+            root_node = root.node if isinstance(root, NodeOutput) else root
+            self.plan_cache.put(root, schedule, {root_node, *schedule.component_of})
+
+        self.schedule = schedule
+        self.output_updated = set()
+        self.output_changed = set()
+        self.pending_inputs = {}
+
+    def stop_execution(self):
+        self.schedule = None
+        self.output_updated = set()
+        self.output_changed = set()
+        self.pending_inputs = {}
+
+    def run_schedule(self):
+        """walks the components and updates all nodes that received data"""
+
+        for i, comp in enumerate(self.schedule.components):
+            if not self.schedule.cyclic[i]:
+                self.run_node(comp[0], i)
+                continue
+
+            for _ in range(self.max_iterations):
+                for node in comp:
+                    self.run_node(node, i)
+                if not any(n in self.pending_inputs for n in comp):
+                    break
+            else:
+                for n in comp:
+                    self.pending_inputs.pop(n, None)
+                try:
+                    raise RuntimeError(
+                        f'no fixed point reached after {self.max_iterations} iterations')
+                except RuntimeError as e:
+                    comp[0].update_err(e)
+
+    def run_node(self, node: Node, component: int):
+        inps = self.pending_inputs.pop(node, None)
+        if inps is None:
+            return
+        self.update_node_inputs(node, inps)
+        for out in node.outputs:
+            self.propagate_output(out, component)
+
+    def propagate_output(self, out: NodeOutput, component: Optional[int]):
+        """marks the connected inputs as pending if the output has been updated; inside
+        the given component, only if its value also didn't converge"""
+
+        if out not in self.output_updated:
+            return
+        self.output_updated.discard(out)
+        changed = out in self.output_changed
+        self.output_changed.discard(out)
+
+        schedule = self.schedule
+        assert schedule is not None, 'outputs are only propagated in an execution'
+        component_of = schedule.component_of
+        for inp in self.graph[out]:
+            if not changed and component_of.get(inp.node) == component:
+                continue
+            index = inp.node.inputs.index(inp)
+            pending = self.pending_inputs.setdefault(inp.node, [])
+            if index not in pending:
+                pending.append(index)
+
+
+class DataFlowBatch(FlowExecutor):
+    """
+    The executor temporarily used by ``Flow.run_batch()``, which pushes a batch of
+    ``size`` items through the flow in one pass.
+
+    Every output updated in the batch holds one value per item. The nodes reachable
+    from the batch's source outputs are visited once, in topological order. A node
+    whose ``Node.batch_format`` is set processes the whole batch at once: its
+    ``input()`` returns a ``Data`` object holding a list (or NumPy array) of the
+    items' payloads, and it must set its outputs to ``Data`` objects holding a
+    sequence of one payload per item. For all other nodes, the update events are
+    invoked for every item separately, as if the items were executed one after
+    another.
+
+    Assumptions for the graph:
+    - no feedback loops / cycles in the graph
+    """
+
+    def __init__(self, flow, size: int):
+        super().__init__(flow)
+
+        self.size = size
+        self.batches: Dict[NodeOutput, Union[Data, List[Optional[Data]]]] = {}
+        self.item: Optional[int] = None     # the current item, None for nodes processing the batch
+        self.node: Optional[Node] = None    # the node currently being processed
+        self.pending_inputs: Dict[Node, List[int]] = {}
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        try:
+            node.update_event(inp)
+        except Exception as e:
+            node.update_err(e)
+
+    # Node.input() =>
+    def input(self, node, index):
+        inp = node.inputs[index]
+        out = self.graph_rev[inp]
+
+        if self.item is not None or node is not self.node:
+            return self.item_value(inp, out, self.item if self.item is not None else self.size - 1)
+
+        payloads = [
+            None if d is None else d.payload
+            for d in (self.item_value(inp, out, k) for k in range(self.size))
+        ]
+        if node.batch_format == 'numpy':
+            # optional dependency, imported dynamically so type checking doesn't depend on it
+            numpy = importlib.import_module('numpy')
+            return Data(numpy.asarray(payloads))
+        return Data(payloads)
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        out = node.outputs[index]
+
+        if self.item is None and node is self.node:
+            if len(data.payload) != self.size:
+                raise ValueError(
+                    f'batch output of {node.title} has {len(data.payload)} items, '
+                    f'expected {self.size}')
+            self.batches[out] = data
+        else:
+            self.items(out)[self.item if self.item is not None else -1] = data
+
+        self.updated(out)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        self.updated(node.outputs[index])
+
+    """
+
+    Helper methods
+
+    """
+
+    def run(self, inputs: Dict[NodeOutput, List[Data]]):
+        """executes the batch from the given source outputs"""
+
+        levels = self.flow.node_levels()
+        if levels is None:
+            raise ValueError('batches can only be executed in acyclic flows')
+
+        for out, items in inputs.items():
+            if len(items) != self.size:
+                raise ValueError(f'got {len(items)} items for an output, expected {self.size}')
+            self.batches[out] = list(items)
+            self.updated(out)
+
+        reached = set(self.pending_inputs)
+        stack = list(reached)
+        while len(stack) > 0:
+            n = stack.pop()
+            for s in self.flow.node_successors[n]:
+                if s not in reached:
+                    reached.add(s)
+                    stack.append(s)
+
+        for node in sorted(reached, key=levels.__getitem__):
+            inps = self.pending_inputs.pop(node, None)
+            if inps is None:
+                continue
+
+            self.node = node
+            if node.batch_format is not None:
+                self.item = None
+                for inp in inps:
+                    node.update(inp=inp)
+            else:
+                for k in range(self.size):
+                    self.item = k
+                    for inp in inps:
+                        node.update(inp=inp)
+            self.item = None
+            self.node = None
+
+        # the outputs keep the values of the last item
+        for out in self.batches:
+            out.val = self.items(out)[-1]
+
+    def updated(self, out: NodeOutput):
+        for inp in self.graph[out]:
+            index = inp.node.inputs.index(inp)
+            if inp.node in self.pending_inputs:
+                if index not in self.pending_inputs[inp.node]:
+                    self.pending_inputs[inp.node].append(index)
+            else:
+                self.pending_inputs[inp.node] = [index]
+
+    def items(self, out: NodeOutput) -> List[Optional[Data]]:
+        """returns the output's values for all items"""
+
+        batch = self.batches.get(out)
+        if batch is None:
+            batch = [out.val] * self.size
+            self.batches[out] = batch
+        elif isinstance(batch, Data):
+            # split the batch set by a node processing whole batches
+            data_type = type(batch)
+            batch = [data_type(p) for p in batch.payload]
+            self.batches[out] = batch
+        return batch
+
+    def item_value(self, inp: NodeInput, out: Optional[NodeOutput], k: int) -> Optional[Data]:
+        if out is None:
+            return inp.default
+        if out not in self.batches:
+            return out.val
+        return self.items(out)[k]
+
+
+class Stream:
+    """
+    The bounded FIFO of a connection in ``DataFlowStream``. All streams into the
+    same node share the node's condition, so the node's stage can wait for items
+    on any of its inputs, and producers block while the stream is full.
+    """
+
+    def __init__(self, inp: NodeInput, index: int, maxsize: int, cond: threading.Condition):
+        self.inp = inp
+        self.index = index
+        self.maxsize = maxsize
+        self.cond = cond
+        self.items: deque = deque()     # (sequence number, data)
+        self.closed = False
+
+    def put(self, seq: int, data: Optional[Data]):
+        with self.cond:
+            while len(self.items) >= self.maxsize:
+                self.cond.wait()
+            self.items.append((seq, data))
+            self.cond.notify_all()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+class DataFlowStream(DataFlowNaive):
+    """
+    *(see also documentation in Flow)*
+
+    A streaming data flow executor. Every connection between the nodes reachable
+    from the node starting an execution gets a bounded FIFO of ``queue_size`` items
+    (a ``Stream``), and every reachable node runs as a pipeline stage in its own
+    thread. Setting an output appends the data to the streams of its connections
+    instead of updating the successors right away, so a source node can emit a
+    whole stream of items in a single update event, e.g. from a generator.
+    A full stream blocks the producing node until its consumer caught up
+    (backpressure), so the memory used is bounded for arbitrarily long streams.
+
+    A stage takes the items from its input streams in the order they were
+    produced, and invokes its node's update event for every item with the index
+    of the input the item arrived at. ``Node.input()`` returns the latest item
+    taken from the input's stream. Once all producers of a stage have finished,
+    the stage finishes, and the execution ends when all stages have finished.
+
+    The update events of the stages (as well as ``Node.updating`` and
+    ``Node.update_error``) are invoked in the stages' threads.
+
+    Assumptions for the graph:
+    - no feedback loops / cycles in the graph
+    - nodes never modify their ports (inputs, outputs) during execution
+    - nodes running in different stages don't access shared state unsynchronized
+    """
+
+    def __init__(self, flow, queue_size: int = 16):
+        super().__init__(flow)
+
+        if queue_size < 1:
+            raise ValueError('queue_size must be at least 1')
+        self.queue_size = queue_size
+
+        self.lock = threading.Lock()
+        self.local = threading.local()  # marks the threads of the running execution
+        self.sequence = itertools.count()
+
+        # execution state
+        self.out_streams: Dict[NodeOutput, List[Stream]] = {}
+        self.in_streams: Dict[Node, List[Stream]] = {}
+        self.conditions: Dict[Node, threading.Condition] = {}
+        self.current: Dict[NodeInput, Optional[Data]] = {}
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        if getattr(self.local, 'executing', False):
+            # inside a stage or the root's update event
+            self.invoke_node_update_event(node, inp)
+        else:
+            with self.lock:
+                self.run_stream(node, inp)
+
+    # Node.input() =>
+    def input(self, node, index):
+        inp = node.inputs[index]
+        if inp in self.current:
+            return self.current[inp]
+        return super().input(node, index)
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        out = node.outputs[index]
+        streams = self.out_streams.get(out)
+        if streams is None or not getattr(self.local, 'executing', False):
+            return super().set_output_val(node, index, data)
+
+        if not out.type_ == 'data':
+            return
+        out.val = data
+
+        seq = next(self.sequence)
+        for stream in streams:
+            stream.put(seq, data)
+
+    """
+
+    Helper methods
+
+    """
+
+    def run_stream(self, root: Node, inp: int):
+        """runs the root's update event and all stages reachable from it until the streams are drained"""
+
+        if self.flow.node_levels() is None:
+            raise ValueError('streams can only be executed in acyclic flows')
+
+        stages = set()
+        stack = [root]
+        while len(stack) > 0:
+            n = stack.pop()
+            for s in self.flow.node_successors[n]:
+                if s not in stages:
+                    stages.add(s)
+                    stack.append(s)
+
+        self.conditions = {n: threading.Condition() for n in stages}
+        self.in_streams = {n: [] for n in stages}
+        for n in [root, *stages]:
+            for out in n.outputs:
+                self.out_streams[out] = []
+                for i in self.graph[out]:
+                    stream = Stream(i, i.node.inputs.index(i), self.queue_size, self.conditions[i.node])
+                    self.out_streams[out].append(stream)
+                    self.in_streams[i.node].append(stream)
+
+        threads = [
+            threading.Thread(target=self.run_stage, args=(n,), name=f'stream stage {n.title}', daemon=True)
+            for n in stages
+        ]
+        for t in threads:
+            t.start()
+
+        self.local.executing = True
+        try:
+            self.invoke_node_update_event(root, inp)
+        finally:
+            self.local.executing = False
+            self.close_outputs(root)
+            for t in threads:
+                t.join()
+
+            self.out_streams = {}
+            self.in_streams = {}
+            self.conditions = {}
+            self.current = {}
+
+    def run_stage(self, node: Node):
+        self.local.executing = True
+        try:
+            while True:
+                item = self.next_item(node)
+                if item is None:
+                    break
+                stream, data = item
+                self.current[stream.inp] = data
+                node.update(inp=stream.index)
+        finally:
+            self.close_outputs(node)
+
+    def next_item(self, node: Node) -> Optional[Tuple[Stream, Optional[Data]]]:
+        """blocks until any input stream of the node has an item, and returns the
+        oldest one; returns None once all input streams are closed and drained"""
+
+        streams = self.in_streams[node]
+        cond = self.conditions[node]
+        with cond:
+            while True:
+                heads = [s for s in streams if len(s.items) > 0]
+                if len(heads) > 0:
+                    stream = min(heads, key=lambda s: s.items[0][0])
+                    _, data = stream.items.popleft()
+                    cond.notify_all()   # wake up blocked producers
+                    return stream, data
+                if all(s.closed for s in streams):
+                    return None
+                cond.wait()
+
+    def close_outputs(self, node: Node):
+        for out in node.outputs:
+            for stream in self.out_streams.get(out, []):
+                stream.close()
+
+
+class DataFlowLazy(DataFlowNaive):
+    """
+    *(see also documentation in Flow)*
+
+    A demand-driven data flow executor. Updating a node or setting an output
+    doesn't compute anything downstream, but only marks the successors *dirty*,
+    together with the inputs which received data. The values are computed once
+    they are read, through ``Node.input()`` or ``Flow.get()``: all dirty
+    ancestors of the read output's node are then pulled in topological order,
+    and every dirty node gets one update event per marked input. Parts of the
+    graph which are never read are never computed.
+
+    Every descendant of a dirty node is dirty as well, so reading a clean
+    node's outputs never needs to look further upstream.
+
+    ``Node.updating`` is emitted when ``Node.update()`` marks a node, while the
+    update event itself only runs once the node's values are pulled.
+
+    Assumptions for the graph:
+    - no feedback loops / cycles in the graph
+    """
+
+    def __init__(self, flow):
+        super().__init__(flow)
+
+        self.dirty: Set[Node] = set()
+        self.pending_inputs: Dict[Node, List[int]] = {}
+
+    # Node.update() =>
+    def update_node(self, node, inp=-1):
+        self.mark(node, inp)
+
+    # Node.input() =>
+    def input(self, node, index):
+        out = self.graph_rev[node.inputs[index]]
+        if out is not None:
+            self.pull(out.node)
+        return super().input(node, index)
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        out = node.outputs[index]
+        if not out.type_ == 'data':
+            return
+        if output_unchanged(out, data):
+            out.val = data
+            return
+        out.val = data
+        self.mark_successors(out)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        out = node.outputs[index]
+        if not out.type_ == 'exec':
+            return
+        self.mark_successors(out)
+
+    # Flow.get() =>
+    def get_output_val(self, out):
+        self.pull(out.node)
+        return out.val
+
+    def conn_added(self, out, inp, silent=False):
+        if out.node in self.dirty:
+            # keep the descendants of dirty nodes dirty
+            self.mark_dirty(inp.node)
+        super().conn_added(out, inp, silent)
+
+    # Flow._flow_changed() =>
+    def graph_changed(self, nodes):
+        super().graph_changed(nodes)
+        for n in nodes:
+            if n not in self.flow.node_successors:  # removed
+                self.dirty.discard(n)
+                self.pending_inputs.pop(n, None)
+
+    """
+
+    Helper methods
+
+    """
+
+    def mark(self, node: Node, inp: int):
+        """marks the input of the node as updated, and the node and its descendants as dirty"""
+
+        pending = self.pending_inputs.setdefault(node, [])
+        if inp not in pending:
+            pending.append(inp)
+        self.mark_dirty(node)
+
+    def mark_successors(self, out: NodeOutput):
+        for inp in self.graph[out]:
+            self.mark(inp.node, inp.node.inputs.index(inp))
+
+    def mark_dirty(self, node: Node):
+        if node in self.dirty:
+            return
+
+        self.dirty.add(node)
+        stack = [node]
+        while len(stack) > 0:
+            n = stack.pop()
+            for s in self.flow.node_successors[n]:
+                if s not in self.dirty:
+                    self.dirty.add(s)
+                    stack.append(s)
+
+    def pull(self, node: Node):
+        """computes the node and all its dirty ancestors"""
+
+        if node not in self.dirty:
+            return
+
+        # iterative post-order DFS through the dirty ancestors
+        order = []
+        visited = {node}
+        stack = [(node, iter(self.flow.node_predecessors[node]))]
+        while len(stack) > 0:
+            n, preds = stack[-1]
+            for p in preds:
+                if p in self.dirty and p not in visited:
+                    visited.add(p)
+                    stack.append((p, iter(self.flow.node_predecessors[p])))
+                    break
+            else:
+                stack.pop()
+                order.append(n)
+
+        for n in order:
+            if n in self.dirty:
+                self.compute(n)
+
+    def compute(self, node: Node):
+        """invokes the update events of a dirty node whose ancestors are clean"""
+
+        self.dirty.discard(node)
+        inps = self.pending_inputs.pop(node, [])
+        if node.block_updates or len(inps) == 0:
+            return
+
+        if node.join_inputs:
+            node.updated_inputs = [inp for inp in inps if inp != -1]
+            inps = [-1]
+        for inp in inps:
+            self.invoke_node_update_event(node, inp)
+
+
+class ExecFlowNaive(FlowExecutor):
+    """
+    ...
+
+    Like in ``DataFlowNaive``, executing an output doesn't recurse into the successors,
+    but schedules their updates on a work stack, which the update that started the
+    execution processes in a loop; this also applies to exec loops which re-trigger
+    themselves. If an update event sets or executes an output again while updates are
+    scheduled, these are processed first, so e.g. the body of a for-each node sees
+    every item. Data is pulled on demand: when a node requests the data of a node
+    which wasn't updated yet, only that node is updated. Its predecessors along a
+    chain of nodes with a single data input are updated first, so data requests
+    don't recurse through long chains either.
+    """
+
+    def __init__(self, flow):
+        super().__init__(flow)
+
+        # all the nodes currently updating because of an output data request
+        # used to prevent redundant predecessor updates during the update
+        # of a single successor
+        self.updated_nodes = None
+
+        self.work: Optional[List[Tuple[Node, int]]] = None   # the stack of pending updates during an execution
+        self.scheduled: List[Tuple[Node, int]] = []          # the updates caused by the current update event
+        self.emitted: Set[NodeOutput] = set()                # the outputs set or executed by it
+
+    # Node.update() = >
+    def update_node(self, node, inp):
+        if inp != -1 and node.inputs[inp].type_ == 'data':
+            return
+
+        execution_starter = self.updated_nodes is None
+
+        if execution_starter:
+            self.updated_nodes = {node}
+            self.work = []
+        else:
+            self.updated_nodes.add(node)
+
+        try:
+            node.update_event(inp)
+        except Exception as e:
+            node.update_err(e)
+
+        if execution_starter:
+            try:
+                self.run_work()
+            finally:
+                self.updated_nodes = None
+                self.work = None
+                self.scheduled = []
+                self.emitted = set()
+
+    # Node.input() =>
+    def input(self, node, index):
+        inp = node.inputs[index]
+        out = self.graph_rev[inp]
+        if out:
+            n = out.node
+            if n not in self.updated_nodes:
+                self.pull(n)
+
+            return out.val
+        else:
+            return None
+
+    # Node.set_output_val() =>
+    def set_output_val(self, node, index, data):
+        out = node.outputs[index]
+        if out in self.emitted:
+            self.flush_scheduled()
+        out.val = data
+        self.emitted.add(out)
+
+    # Node.exec_output() =>
+    def exec_output(self, node, index):
+        out = node.outputs[index]
+        if out in self.emitted:
+            self.flush_scheduled()
+        for inp in self.graph[out]:
+            self.scheduled.append((inp.node, inp.node.inputs.index(inp)))
+        self.emitted.add(out)
+
+        if self.work is None:  # execution starter!
+            self.updated_nodes = set()
+            self.work = []
+            try:
+                self.run_work()
+            finally:
+                self.updated_nodes = None
+                self.work = None
+                self.scheduled = []
+                self.emitted = set()
+
+    """
+
+    Helper methods
+
+    """
+
+    def run_work(self):
+        """processes the work stack until all scheduled updates are done"""
+
+        work = self.work
+        while True:
+            if len(self.scheduled) > 0:
+                # the first scheduled update goes on top
+                work.extend(reversed(self.scheduled))
+                self.scheduled = []
+            if len(self.emitted) > 0:
+                self.emitted = set()
+            if len(work) == 0:
+                break
+            node, inp = work.pop()
+            node.update(inp)
+
+    def flush_scheduled(self):
+        """
+        Processes the updates scheduled by the current update event so far, with a nested
+        work stack, before it sets or executes an output again, e.g. in a loop.
+        """
+
+        if self.work is None or len(self.scheduled) == 0:
+            return
+        work, self.work = self.work, []
+        try:
+            self.run_work()
+        finally:
+            self.work = work
+
+    def pull(self, node):
+        """
+        Updates the node whose data was requested. A node with a single data input is
+        expected to request it as well, so the chain of predecessors which weren't
+        updated yet and have a single data input is updated first, predecessors first.
+        Nodes with several data inputs request the ones they need on demand.
+        """
+
+        chain = [node]
+        pred = self.single_data_predecessor(node)
+        while pred is not None and pred not in self.updated_nodes and pred not in chain:
+            chain.append(pred)
+            pred = self.single_data_predecessor(pred)
+
+        for n in reversed(chain):
+            if n not in self.updated_nodes:
+                n.update(-1)
+
+    def single_data_predecessor(self, node) -> Optional[Node]:
+        """returns the predecessor connected to the node's data input if it has only one"""
+
+        data_inputs = [inp for inp in node.inputs if inp.type_ == 'data']
+        if len(data_inputs) != 1:
+            return None
+        out = self.graph_rev[data_inputs[0]]
+        return out.node if out is not None else None
 
 
 def executor_from_flow_alg(algorithm: FlowAlg):
@@ -372,5 +2865,23 @@ def executor_from_flow_alg(algorithm: FlowAlg):
         return DataFlowNaive
     if algorithm == FlowAlg.DATA_OPT:
         return DataFlowOptimized
+    if algorithm == FlowAlg.DATA_SCHED:
+        return DataFlowScheduled
+    if algorithm == FlowAlg.DATA_PARALLEL:
+        return DataFlowParallel
+    if algorithm == FlowAlg.DATA_PROCESS:
+        return DataFlowMultiProcess
+    if algorithm == FlowAlg.DATA_ASYNC:
+        return DataFlowAsync
+    if algorithm == FlowAlg.DATA_STREAM:
+        return DataFlowStream
+    if algorithm == FlowAlg.DATA_MEMO:
+        return DataFlowMemo
+    if algorithm == FlowAlg.DATA_LAZY:
+        return DataFlowLazy
+    if algorithm == FlowAlg.DATA_CYCLIC:
+        return DataFlowFixedPoint
+    if algorithm == FlowAlg.DATA_SLICED:
+        return DataFlowSliced
     if algorithm == FlowAlg.EXEC:
         return ExecFlowNaive
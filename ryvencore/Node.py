@@ -49,6 +49,46 @@ class Node(Base):
     identifier_prefix: Optional[str] = None
     """becomes part of the identifier if set; can be useful for grouping nodes"""
 
+    batch_format: Optional[str] = None
+    """if set to 'list' or 'numpy', the node processes whole batches in ``Flow.run_batch()``: inputs are
+    ``Data`` objects holding a list or NumPy array of the items' payloads, and outputs must be set to ``Data``
+    objects holding a sequence of one payload per item (see ``DataFlowBatch``)"""
+
+    output_dependencies: Optional[Dict[int, List[int]]] = None
+    """maps output indices to the indices of the inputs they depend on; by default, every output depends on all
+    inputs. The 'data opt' based modes only propagate the outputs which depend on the inputs that received data"""
+
+    join_inputs: bool = False
+    """if set, the executors which know when all inputs of a node have settled in an execution (the 'data opt'
+    based modes, 'data sched', 'data cyclic', and 'data lazy') invoke ``update_event()`` only once per execution,
+    with ``inp=-1``, instead of once for every input which received data; those inputs are listed in
+    ``updated_inputs``"""
+
+    early_cutoff: bool = False
+    """if set, setting a data output to a value equal to its current one (see ``Data.equals()``) doesn't update
+    the successors in the data modes, except for 'data stream' and batches"""
+
+    pure: bool = False
+    """declares that the outputs only depend on the inputs and the state (``get_state()``), so in the 'data memo'
+    algorithm mode the executor can reuse previous outputs instead of invoking ``update_event()`` again
+    (see ``DataFlowMemo``); pure nodes which don't depend on other nodes are folded (see ``Flow.fold_constants()``)"""
+
+    priority: int = 0
+    """in the 'data opt' based algorithm modes, nodes with higher priority are updated and propagated first when
+    several are ready; a node inherits the priorities of its successors, so the predecessors of critical nodes go
+    first as well (see ``Flow.node_priorities()``). In 'data opt', updates of nodes below ``defer_below`` can
+    be deferred to idle time (see ``Flow.run_deferred()``). The flow keeps the effective priorities up to date when
+    connections change, so the priority should be set before the node is connected"""
+
+    coalesce: Optional[Dict[int, Tuple[str, float]]] = None
+    """coalescing policies for data outputs which are set at a high frequency, mapping output indices, or -1 for all
+    outputs, to ``('latest', min_interval)``, ``('rate', max_rate)``, or ``('frame', 0)`` (see ``Flow.coalesce_output()``);
+    values which *latest* holds back are set by ``Flow.clock`` when the interval ends, all of them by ``Flow.flush()``"""
+
+    run_in_process: bool = False
+    """if set, the update events run in a worker process in the 'data process' algorithm mode,
+    where they can only access the node's inputs, outputs, and state (see ``DataFlowMultiProcess``)"""
+
     #
     # INITIALIZATION
     #
@@ -84,6 +124,9 @@ class Node(Base):
         self.block_init_updates = False
         self.block_updates = False
 
+        # the indices of the inputs which received data before the last joined update, see join_inputs
+        self.updated_inputs: List[int] = []
+
         # events
         self.updating = Event(int)
         self.update_error = Event(Exception)
@@ -160,12 +203,55 @@ class Node(Base):
             InfoMsgs.write('update blocked in', self.title, 'node')
             return
 
+        if self.flow.cancellation.cancelled:
+            InfoMsgs.write('update cancelled in', self.title, 'node')
+            return
+
+        if self.pure and self.flow.check_folded_update(self, inp):
+            InfoMsgs.write('update skipped in frozen', self.title, 'node')
+            return
+
         InfoMsgs.write('update in', self.title, 'node on input', inp)
 
         # invoke update_event
         self.updating.emit(inp)
         self.flow.executor.update_node(self, inp)
 
+    async def update_async(self, inp=-1):
+        """
+        Like ``update()``, but returns an awaitable which completes once the
+        resulting flow execution has finished. In the 'data async' algorithm mode,
+        ``update_event()`` can be a coroutine function, see ``DataFlowAsync``.
+        """
+
+        if self.block_updates:
+            InfoMsgs.write('update blocked in', self.title, 'node')
+            return
+
+        if self.flow.cancellation.cancelled:
+            InfoMsgs.write('update cancelled in', self.title, 'node')
+            return
+
+        if self.pure and self.flow.check_folded_update(self, inp):
+            InfoMsgs.write('update skipped in frozen', self.title, 'node')
+            return
+
+        InfoMsgs.write('async update in', self.title, 'node on input', inp)
+
+        self.updating.emit(inp)
+        await self.flow.executor.update_node_async(self, inp)
+
+    def dependent_outputs(self, inp: int) -> List[NodeOutput]:
+        """
+        Returns the outputs which depend on the input of given index, or all outputs
+        for ``inp=-1``, according to ``output_dependencies``.
+        """
+
+        deps = self.output_dependencies
+        if deps is None or inp == -1:
+            return self.outputs
+        return [out for i, out in enumerate(self.outputs) if inp in deps.get(i, ())]
+
     def update_err(self, e):
         InfoMsgs.write_err('EXCEPTION in', self.title, '\n', traceback.format_exc())
         self.update_error.emit(e)
@@ -200,6 +286,9 @@ class Node(Base):
 
         InfoMsgs.write('setting output', index, 'in', self.title)
 
+        if self.coalesce is not None and self.flow.coalesce_output(self, index, data):
+            return
+
         self.flow.executor.set_output_val(self, index, data)
 
     """
@@ -216,6 +305,9 @@ class Node(Base):
 
         Gets called when an input received a signal or some node requested data of an output in exec mode.
         Implement this in your node class, this is the place where the main processing of your node should happen.
+        In the 'data async' algorithm mode, this can also be a coroutine function (``async def``).
+        Long running update events can check ``self.flow.cancellation.cancelled`` to stop early
+        when their execution has been superseded (see ``TriggerQueue``).
         """
 
         pass
@@ -334,7 +426,7 @@ class Node(Base):
         # break all connections
         out = self.flow.connected_output(inp)
         if out is not None:
-            self.flow.connect_nodes(out, inp)
+            self.flow.disconnect_nodes(out, inp)
 
         self.inputs.remove(inp)
 
@@ -376,8 +468,8 @@ class Node(Base):
         out: NodeOutput = self.outputs[index]
 
         # break all connections
-        for inp in self.flow.connected_inputs(out):
-            self.flow.connect_nodes(out, inp)
+        for inp in list(self.flow.connected_inputs(out)):
+            self.flow.disconnect_nodes(out, inp)
 
         self.outputs.remove(out)
 
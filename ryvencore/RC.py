@@ -9,6 +9,15 @@ class FlowAlg(IntEnum):
     DATA = 1
     EXEC = 2
     DATA_OPT = 3
+    DATA_SCHED = 4
+    DATA_PARALLEL = 5
+    DATA_PROCESS = 6
+    DATA_ASYNC = 7
+    DATA_STREAM = 8
+    DATA_MEMO = 9
+    DATA_LAZY = 10
+    DATA_CYCLIC = 11
+    DATA_SLICED = 12
 
     @staticmethod
     def str(mode):
@@ -18,6 +27,24 @@ class FlowAlg(IntEnum):
             return 'data'
         elif mode == FlowAlg.EXEC:
             return 'exec'
+        elif mode == FlowAlg.DATA_SCHED:
+            return 'data sched'
+        elif mode == FlowAlg.DATA_PARALLEL:
+            return 'data parallel'
+        elif mode == FlowAlg.DATA_PROCESS:
+            return 'data process'
+        elif mode == FlowAlg.DATA_ASYNC:
+            return 'data async'
+        elif mode == FlowAlg.DATA_STREAM:
+            return 'data stream'
+        elif mode == FlowAlg.DATA_MEMO:
+            return 'data memo'
+        elif mode == FlowAlg.DATA_LAZY:
+            return 'data lazy'
+        elif mode == FlowAlg.DATA_CYCLIC:
+            return 'data cyclic'
+        elif mode == FlowAlg.DATA_SLICED:
+            return 'data sliced'
         else:  # FlowAlg.DATA_OPT
             return 'data opt'
 
@@ -29,6 +56,24 @@ class FlowAlg(IntEnum):
             return FlowAlg.EXEC
         elif mode == 'data opt':
             return FlowAlg.DATA_OPT
+        elif mode == 'data sched':
+            return FlowAlg.DATA_SCHED
+        elif mode == 'data parallel':
+            return FlowAlg.DATA_PARALLEL
+        elif mode == 'data process':
+            return FlowAlg.DATA_PROCESS
+        elif mode == 'data async':
+            return FlowAlg.DATA_ASYNC
+        elif mode == 'data stream':
+            return FlowAlg.DATA_STREAM
+        elif mode == 'data memo':
+            return FlowAlg.DATA_MEMO
+        elif mode == 'data lazy':
+            return FlowAlg.DATA_LAZY
+        elif mode == 'data cyclic':
+            return FlowAlg.DATA_CYCLIC
+        elif mode == 'data sliced':
+            return FlowAlg.DATA_SLICED
         else:
             raise ValueError(f'Invalid mode: {mode}')
 
@@ -0,0 +1,226 @@
+"""
+This module defines the trigger queue of a flow, through which other threads can
+request updates safely.
+
+The flow executors are not thread-safe: ``Node.update()`` and
+``Node.set_output_val()`` must not be called concurrently. Threads like network
+handlers or device callbacks therefore enqueue their updates in
+:code:`Flow.triggers` instead, which is cheap and never blocks on a running
+execution. A single dispatcher, either the thread started by
+:code:`TriggerQueue.start()` or the application calling :code:`TriggerQueue.dispatch()`,
+drains the queue in batches and runs the updates. Every enqueued update returns a
+:code:`concurrent.futures.Future` which completes once it has been executed.
+
+With :code:`TriggerQueue.supersede` set, a new trigger for a node or output of the
+batch which is currently running cancels that batch: the nodes of its executions
+which have not run yet are skipped (see :code:`Flow.cancellation`), and the
+dispatcher continues with the new triggers. The other triggers of the batch are
+enqueued again, so they run with the new ones. Long update events can check the
+token themselves to stop early.
+"""
+# prevent cyclic imports
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .Flow import Flow
+    from .Node import Node
+
+import threading
+from concurrent.futures import Future, CancelledError
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .Data import Data
+from .NodePort import NodeOutput
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation of the executions of a trigger batch. ``Node.update()``
+    skips the update events of nodes while the flow's token is cancelled, and update
+    events can check :code:`self.flow.cancellation.cancelled` to abandon their work.
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+class TriggerQueue:
+    """
+    A thread-safe queue of node updates and output values for a flow.
+    Duplicates are coalesced until the next batch is dispatched: updates of the same
+    node and input share one future, and for an output only the most recent value
+    is set. A batch first sets the output values, then updates all nodes which were
+    triggered without an input in one combined execution (see
+    :code:`Flow.update_many()`), and finally the updates of specific inputs.
+    Triggers whose futures have been cancelled are dropped.
+
+    If ``supersede`` is set, enqueuing a trigger which replaces a trigger of the running
+    batch cancels the batch. The futures of the replaced triggers fail with a
+    :code:`concurrent.futures.CancelledError`, the other triggers which haven't
+    completed yet are enqueued again, with their futures.
+    """
+
+    def __init__(self, flow: Flow, supersede: bool = False):
+        self.flow = flow
+        self.supersede = supersede
+
+        # (node, inp) or output -> (future, value)
+        self._triggers: Dict[Union[Tuple[Node, int], NodeOutput], Tuple[Future, Optional[Data]]] = {}
+        self._token: Optional[CancellationToken] = None  # of the running batch
+        self._batch: Dict = {}  # the triggers of the running batch
+        self._superseded = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def update(self, node: Node, inp: int = -1) -> Future:
+        """Enqueues ``node.update(inp)``; can be called from any thread."""
+        return self._enqueue((node, inp), None)
+
+    def set_output_val(self, node: Node, index: int, data: Data) -> Future:
+        """Enqueues ``node.set_output_val(index, data)``; can be called from any thread."""
+        return self._enqueue(node.outputs[index], data)
+
+    def __len__(self):
+        return len(self._triggers)
+
+    def dispatch(self) -> int:
+        """
+        Runs all triggers enqueued so far, in the calling thread, and returns
+        how many there were.
+        """
+
+        token = CancellationToken()
+        with self._lock:
+            triggers, self._triggers = self._triggers, {}
+            self._token = token
+            self._batch = triggers
+            self._superseded = False
+
+        outputs: List[NodeOutput] = []
+        roots: List[Tuple[Node, int]] = []
+        inputs: List[Tuple[Node, int]] = []
+        for key, (future, data) in triggers.items():
+            # triggers which were enqueued again are running already
+            if not future.running() and not future.set_running_or_notify_cancel():
+                continue
+            if isinstance(key, NodeOutput):
+                outputs.append(key)
+            elif key[1] == -1:
+                roots.append(key)
+            else:
+                inputs.append(key)
+
+        self.flow.cancellation = token
+        try:
+            for out in outputs:
+                self._run(token, [out], out.node.set_output_val, out.node.outputs.index(out), triggers[out][1])
+            if len(roots) > 0:
+                self._run(token, roots, self.flow.update_many, [node for node, _ in roots])
+            for key in inputs:
+                self._run(token, [key], key[0].update, key[1])
+        finally:
+            with self._lock:
+                self._token = None
+                self._batch = {}
+            self.flow.cancellation = CancellationToken()
+
+        return len(triggers)
+
+    def cancel(self):
+        """Cancels the batch which is currently being dispatched, if any."""
+
+        with self._lock:
+            if self._token is not None:
+                self._token.cancel()
+
+    def start(self):
+        """Runs a dispatcher thread which dispatches new triggers as soon as they arrive."""
+
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run_dispatcher, name='ryvencore dispatcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the dispatcher thread after the current batch; remaining triggers stay queued."""
+
+        if self._thread is None:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """whether the dispatcher thread is running"""
+        return self._thread is not None
+
+    """
+
+    Helper methods
+
+    """
+
+    def _enqueue(self, key, data: Optional[Data]) -> Future:
+        with self._lock:
+            trigger = self._triggers.get(key)
+            # a cancelled trigger is replaced by a new one
+            future = trigger[0] if trigger is not None and not trigger[0].done() else Future()
+            self._triggers[key] = (future, data)
+            if self.supersede and self._token is not None and key in self._batch:
+                self._superseded = True
+                self._token.cancel()
+        self._wakeup.set()
+        return future
+
+    def _run(self, token: CancellationToken, keys: List, func: Callable, *args):
+        futures = [self._batch[key][0] for key in keys]
+        if not token.cancelled:
+            try:
+                func(*args)
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                return
+        if token.cancelled:
+            # cancelled before or during the execution
+            self._cancelled(keys)
+        else:
+            for future in futures:
+                future.set_result(None)
+
+    def _cancelled(self, keys: List):
+        """fails the futures of cancelled triggers, or, if the batch was superseded,
+        enqueues the triggers which haven't been replaced again"""
+
+        failed = []
+        with self._lock:
+            for key in keys:
+                future, data = self._batch[key]
+                if not self._superseded or key in self._triggers:
+                    failed.append(future)
+                else:
+                    self._triggers[key] = (future, data)
+        for future in failed:
+            future.set_exception(CancelledError())
+        if len(failed) < len(keys):
+            self._wakeup.set()
+
+    def _run_dispatcher(self):
+        while self._running:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._running:
+                self.dispatch()
@@ -1,6 +1,7 @@
 """A collection of useful functions used by different components."""
 
 import base64
+import hashlib
 import json
 import pickle
 import sys
@@ -38,6 +39,14 @@ def deserialize(data):
     return pickle.loads(base64.b64decode(data))
 
 
+def fingerprint(data) -> Optional[bytes]:
+    """returns a digest of the pickled data, or None if it cannot be pickled"""
+    try:
+        return hashlib.blake2b(pickle.dumps(data), digest_size=16).digest()
+    except Exception:
+        return None
+
+
 def print_err(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
@@ -0,0 +1,83 @@
+import unittest
+import ryvencore as rc
+
+
+class Sensor(rc.Node):
+    init_outputs = [rc.NodeOutputType(), rc.NodeOutputType()]
+
+    def push(self, index, val):
+        self.set_output_val(index, rc.Data(val))
+
+
+class Sink(rc.Node):
+    init_inputs = [rc.NodeInputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.vals = []
+
+    def update_event(self, inp=-1):
+        self.vals.append(self.input(0).payload)
+
+
+class CoalescedUpdates(unittest.TestCase):
+
+    def runTest(self):
+        for mode in ['data', 'data opt']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Sensor, Sink])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode)
+
+                now = [0.0]
+                f.clock.time_func = lambda: now[0]
+
+                sensor = f.create_node(Sensor)
+                sinks = [f.create_node(Sink) for _ in range(2)]
+                for i in range(2):
+                    f.connect_nodes(sensor.outputs[i], sinks[i].inputs[0], silent=True)
+
+                sensor.coalesce = {0: ('latest', 3600), 1: ('rate', 1 / 3600)}
+                for val in range(5):
+                    sensor.push(0, val)
+                    sensor.push(1, val)
+                # the first values are set, later ones are held back or dropped
+                self.assertEqual([s.vals for s in sinks], [[0], [0]])
+                self.assertEqual(sensor.outputs[0].val.payload, 0)
+
+                f.flush()
+                self.assertEqual([s.vals for s in sinks], [[0, 4], [0]])
+                f.flush()
+                self.assertEqual([s.vals for s in sinks], [[0, 4], [0]])
+
+                # per-node policies
+                sensor.coalesce = {-1: ('frame', 0)}
+                for val in range(5, 10):
+                    sensor.push(0, val)
+                    sensor.push(1, val)
+                self.assertEqual([s.vals for s in sinks], [[0, 4], [0]])
+                f.flush()
+                self.assertEqual([s.vals for s in sinks], [[0, 4, 9], [0, 9]])
+
+                # the clock delivers the last value held back when the interval ends
+                sensor.coalesce = {0: ('latest', 0.5)}
+                for val in range(10, 15):
+                    sensor.push(0, val)
+                self.assertEqual(f.clock.next_due(), 0.5)
+                now[0] = 0.4
+                f.clock.tick()
+                self.assertEqual(sinks[0].vals, [0, 4, 9])
+                now[0] = 0.5
+                f.clock.tick()
+                self.assertEqual(sinks[0].vals, [0, 4, 9, 14])
+                self.assertIsNone(f.clock.next_due())
+
+                sensor.coalesce = {0: ('debounce', 1)}
+                with self.assertRaises(ValueError):
+                    sensor.push(0, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import ryvencore as rc
+
+
+class Const(rc.Node):
+    pure = True
+
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.value = 1
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.value))
+
+    def get_state(self):
+        return {'value': self.value}
+
+    def set_state(self, data, version):
+        self.value = data['value']
+
+
+class AddDefault(rc.Node):
+    """adds the default of the second input to the first one"""
+
+    pure = True
+
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType(default=rc.Data(10))]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.input(0).payload + self.input(1).payload))
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(0))
+
+
+class Sink(rc.Node):
+    init_inputs = [rc.NodeInputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.vals = []
+
+    def update_event(self, inp=-1):
+        self.vals.append(self.input(0).payload)
+
+
+class ConstantFolding(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Const, AddDefault, Sink])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data opt')
+
+        c = f.create_node(Const)
+        add = f.create_node(AddDefault)
+        sink = f.create_node(Sink)
+        f.connect_nodes(c.outputs[0], add.inputs[0], silent=True)
+        f.connect_nodes(add.outputs[0], sink.inputs[0], silent=True)
+        self.assertEqual(f.constant_nodes(), {c, add})
+
+        # the constant nodes are evaluated once after loading
+        s2 = rc.Session()
+        s2.register_node_types([Source, Const, AddDefault, Sink])
+        f2 = s2.load(s.serialize())[0]
+        c, add, sink = f2.nodes
+        self.assertEqual((c.num_updates, add.num_updates), (1, 1))
+        self.assertEqual(sink.vals, [11])
+
+        # and frozen afterwards
+        c.update()
+        add.update()
+        f2.fold_constants()
+        self.assertEqual((c.num_updates, add.num_updates), (1, 1))
+        self.assertEqual(sink.vals, [11])
+
+        # until their state changes
+        c.value = 5
+        c.update()
+        self.assertEqual((c.num_updates, add.num_updates), (2, 2))
+        self.assertEqual(sink.vals, [11, 15])
+        c.update()
+        add.update()
+        self.assertEqual((c.num_updates, add.num_updates), (2, 2))
+
+        # nodes depending on non-constant nodes are not frozen
+        src = f2.create_node(Source)
+        f2.connect_nodes(src.outputs[0], add.inputs[1], silent=True)
+        self.assertEqual(f2.constant_nodes(), {c})
+        src.update()
+        add.update()
+        self.assertEqual(add.num_updates, 4)
+        self.assertEqual(sink.vals[-1], 5)
+
+        # the constant nodes are kept up to date as connections change
+        f2.disconnect_nodes(src.outputs[0], add.inputs[1], silent=True)
+        self.assertEqual(f2.constant_nodes(), {c, add})
+        f2.remove_node(add)
+        self.assertEqual(f2.constant_nodes(), {c})
+
+
+if __name__ == '__main__':
+    unittest.main()
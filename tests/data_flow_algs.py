@@ -0,0 +1,482 @@
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.val = 0
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(self.val))
+
+
+class Add(rc.Node):
+    """adds both inputs; counts update events"""
+
+    init_inputs = [
+        rc.NodeInputType(default=rc.Data(0)),
+        rc.NodeInputType(default=rc.Data(0)),
+    ]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.val(0) + self.val(1)))
+
+    def val(self, index):
+        d = self.input(index)
+        return d.payload if d is not None else 0
+
+
+def build_diamonds(mode: str, depth: int):
+    """
+    builds a chain of ``depth`` diamonds
+    src -> (a, b) -> c -> (a, b) -> c ...
+    and returns the flow, the source, and the last node
+    """
+
+    s = rc.Session()
+    s.register_node_types([Source, Add])
+    f = s.create_flow('main')
+    f.set_algorithm_mode(mode)
+
+    src = f.create_node(Source)
+    last = src
+    for _ in range(depth):
+        a = f.create_node(Add)
+        b = f.create_node(Add)
+        c = f.create_node(Add)
+        f.connect_nodes(last.outputs[0], a.inputs[0])
+        f.connect_nodes(last.outputs[0], b.inputs[0])
+        f.connect_nodes(a.outputs[0], c.inputs[0])
+        f.connect_nodes(b.outputs[0], c.inputs[1])
+        last = c
+
+    return f, src, last
+
+
+class DataFlowDiamonds(unittest.TestCase):
+    """every edge is activated at most once per execution"""
+
+    modes = ['data opt', 'data sched', 'data parallel']
+    depth = 8
+
+    def runTest(self):
+        for mode in self.modes:
+            with self.subTest(mode=mode):
+                f, src, last = build_diamonds(mode, self.depth)
+                last.num_updates = 0
+
+                src.val = 1
+                src.update()
+
+                self.assertEqual(last.outputs[0].val.payload, 2 ** self.depth)
+                self.assertEqual(last.num_updates, 2)
+
+                # repeated execution reuses the analysis
+                last.num_updates = 0
+                src.val = 2
+                src.update()
+
+                self.assertEqual(last.outputs[0].val.payload, 2 * 2 ** self.depth)
+                self.assertEqual(last.num_updates, 2)
+
+                # an output as execution root
+                last.num_updates = 0
+                src.set_output_val(0, rc.Data(3))
+
+                self.assertEqual(last.outputs[0].val.payload, 3 * 2 ** self.depth)
+                self.assertEqual(last.num_updates, 2)
+
+
+class DataFlowNaiveDiamonds(unittest.TestCase):
+
+    def runTest(self):
+        f, src, last = build_diamonds('data', 4)
+        last.num_updates = 0
+
+        src.val = 1
+        src.update()
+
+        self.assertEqual(last.outputs[0].val.payload, 2 ** 4)
+        # every diamond doubles the number of updates downstream
+        self.assertEqual(last.num_updates, 2 ** 4)
+
+
+class DataFlowScheduledGraphChanges(unittest.TestCase):
+
+    def runTest(self):
+        f, src, last = build_diamonds('data sched', 2)
+        src.val = 1
+        src.update()
+        self.assertEqual(last.outputs[0].val.payload, 4)
+
+        # extending the graph recompiles the schedule
+        extra = f.create_node(Add)
+        f.connect_nodes(last.outputs[0], extra.inputs[0])
+        f.connect_nodes(src.outputs[0], extra.inputs[1])
+
+        extra.num_updates = 0
+        src.val = 2
+        src.update()
+        self.assertEqual(extra.outputs[0].val.payload, 8 + 2)
+        self.assertEqual(extra.num_updates, 2)
+
+
+class FlowIncrementalAnalysis(unittest.TestCase):
+
+    def check_levels(self, f):
+        levels = f.node_levels()
+        for n in f.nodes:
+            for s in f.node_successors[n]:
+                self.assertLess(levels[n], levels[s])
+
+    def runTest(self):
+        f, src, last = build_diamonds('data opt', 3)
+        self.check_levels(f)
+
+        src.update()
+        self.assertIn(src, f.executor.plan_cache)
+
+        # edits outside the analyzed subgraph don't invalidate the analysis
+        n1 = f.create_node(Add)
+        n2 = f.create_node(Add)
+        f.connect_nodes(n1.outputs[0], n2.inputs[0], silent=True)
+        self.assertIn(src, f.executor.plan_cache)
+        self.check_levels(f)
+
+        # neither do connections from outside into the analyzed subgraph,
+        # which raise the levels of the successors
+        f.connect_nodes(n2.outputs[0], f.nodes[1].inputs[1], silent=True)
+        self.assertIn(src, f.executor.plan_cache)
+        self.check_levels(f)
+
+        # edits inside the analyzed subgraph do
+        extra = f.create_node(Add)
+        f.connect_nodes(last.outputs[0], extra.inputs[0], silent=True)
+        self.assertNotIn(src, f.executor.plan_cache)
+        self.check_levels(f)
+
+        # cycles are detected, and the levels recovered once they are removed
+        f.connect_nodes(extra.outputs[0], n1.inputs[0], silent=True)
+        self.assertIsNone(f.node_levels())
+        f.disconnect_nodes(extra.outputs[0], n1.inputs[0], silent=True)
+        self.check_levels(f)
+
+
+class DataFlowPlanCache(unittest.TestCase):
+
+    def runTest(self):
+        for mode in ['data opt', 'data sched', 'data parallel']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Source, Add])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode, plan_cache_size=2)
+
+                sources = [f.create_node(Source) for _ in range(3)]
+                sink = f.create_node(Add)
+                f.connect_nodes(sources[0].outputs[0], sink.inputs[0], silent=True)
+                f.connect_nodes(sources[1].outputs[0], sink.inputs[1], silent=True)
+
+                cache = f.executor.plan_cache
+
+                # alternating roots hit the cache
+                for _ in range(3):
+                    sources[0].update()
+                    sources[1].update()
+                self.assertEqual(cache.misses, 2)
+                self.assertEqual(cache.hits, 4)
+
+                # least recently used plans are evicted
+                sources[2].update()
+                self.assertEqual(len(cache), 2)
+                self.assertNotIn(sources[0], cache)
+                self.assertIn(sources[1], cache)
+
+                # graph edits invalidate the affected plans only
+                f.connect_nodes(sources[2].outputs[0], f.create_node(Add).inputs[0], silent=True)
+                self.assertNotIn(sources[2], cache)
+                self.assertIn(sources[1], cache)
+
+
+class DataFlowUpdatedOutputs(unittest.TestCase):
+    """only the outputs updated in the current execution are propagated"""
+
+    class Switch(rc.Node):
+        init_inputs = [rc.NodeInputType()]
+        init_outputs = [rc.NodeOutputType(), rc.NodeOutputType()]
+
+        def update_event(self, inp=-1):
+            val = self.input(0).payload
+            self.set_output_val(val % 2, rc.Data(val))
+
+    def runTest(self):
+        for mode in ['data opt', 'data sched', 'data parallel']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Source, Add, self.Switch])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode)
+
+                src = f.create_node(Source)
+                switch = f.create_node(self.Switch)
+                even = f.create_node(Add)
+                odd = f.create_node(Add)
+                f.connect_nodes(src.outputs[0], switch.inputs[0], silent=True)
+                f.connect_nodes(switch.outputs[0], even.inputs[0], silent=True)
+                f.connect_nodes(switch.outputs[1], odd.inputs[0], silent=True)
+
+                for val in [2, 3, 4]:
+                    src.val = val
+                    src.update()
+                self.assertEqual(even.num_updates, 2)
+                self.assertEqual(odd.num_updates, 1)
+                self.assertEqual(even.outputs[0].val.payload, 4)
+                self.assertEqual(odd.outputs[0].val.payload, 3)
+
+
+class DataFlowJoinInputs(unittest.TestCase):
+    """join nodes are updated once, after all inputs settled"""
+
+    class Sum(rc.Node):
+        join_inputs = True
+
+        init_inputs = [rc.NodeInputType(default=rc.Data(0)) for _ in range(3)]
+        init_outputs = [rc.NodeOutputType()]
+
+        def __init__(self, params):
+            super().__init__(params)
+
+            self.calls = []
+
+        def update_event(self, inp=-1):
+            self.calls.append((inp, sorted(self.updated_inputs)))
+            self.set_output_val(0, rc.Data(sum(self.input(i).payload for i in range(3))))
+
+    def runTest(self):
+        for mode in ['data opt', 'data sched', 'data parallel', 'data cyclic']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Source, Add, self.Sum])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode)
+
+                # src -> (a, b) -> sum, src -> sum
+                src = f.create_node(Source)
+                a = f.create_node(Add)
+                b = f.create_node(Add)
+                sum_ = f.create_node(self.Sum)
+                f.connect_nodes(src.outputs[0], a.inputs[0], silent=True)
+                f.connect_nodes(src.outputs[0], b.inputs[0], silent=True)
+                f.connect_nodes(a.outputs[0], sum_.inputs[0], silent=True)
+                f.connect_nodes(b.outputs[0], sum_.inputs[1], silent=True)
+                f.connect_nodes(src.outputs[0], sum_.inputs[2], silent=True)
+
+                src.val = 1
+                src.update()
+                self.assertEqual(sum_.calls, [(-1, [0, 1, 2])])
+                self.assertEqual(sum_.outputs[0].val.payload, 3)
+
+
+class DataFlowEarlyCutoff(unittest.TestCase):
+    """unchanged outputs of early cutoff nodes are not propagated"""
+
+    class Threshold(rc.Node):
+        early_cutoff = True
+
+        init_inputs = [rc.NodeInputType()]
+        init_outputs = [rc.NodeOutputType()]
+
+        def update_event(self, inp=-1):
+            self.set_output_val(0, rc.Data(int(self.input(0).payload > 5)))
+
+    def runTest(self):
+        for mode in ['data', 'data opt', 'data sched', 'data parallel', 'data cyclic']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Source, Add, self.Threshold])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode)
+
+                # src -> thr -> cut, and src -> thr -> add <- src, add -> sink
+                src = f.create_node(Source)
+                thr = f.create_node(self.Threshold)
+                cut = f.create_node(Add)
+                add = f.create_node(Add)
+                sink = f.create_node(Add)
+                f.connect_nodes(src.outputs[0], thr.inputs[0], silent=True)
+                f.connect_nodes(thr.outputs[0], cut.inputs[0], silent=True)
+                f.connect_nodes(thr.outputs[0], add.inputs[0], silent=True)
+                f.connect_nodes(src.outputs[0], add.inputs[1], silent=True)
+                f.connect_nodes(add.outputs[0], sink.inputs[0], silent=True)
+
+                for val, num_cut_updates in [(1, 1), (2, 1), (3, 1), (10, 2), (11, 2)]:
+                    src.val = val
+                    src.update()
+                    self.assertEqual(cut.num_updates, num_cut_updates)
+                    # the other branch is still executed once
+                    self.assertEqual(sink.outputs[0].val.payload, val + int(val > 5))
+
+                if mode != 'data':
+                    # the naive algorithm updates add once for every input
+                    self.assertEqual(sink.num_updates, 5)
+
+
+class DataFlowOutputDependencies(unittest.TestCase):
+    """outputs which don't depend on the updated inputs are not part of the execution"""
+
+    class Split(rc.Node):
+        """forwards each input to the output of the same index"""
+
+        init_inputs = [rc.NodeInputType(), rc.NodeInputType()]
+        init_outputs = [rc.NodeOutputType(), rc.NodeOutputType()]
+        output_dependencies = {0: [0], 1: [1]}
+
+        def update_event(self, inp=-1):
+            for i in ([0, 1] if inp == -1 else [inp]):
+                if self.input(i) is not None:
+                    self.set_output_val(i, self.input(i))
+
+    def runTest(self):
+        for mode in ['data opt', 'data parallel']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Source, Add, self.Split])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode)
+
+                # (src1, src2) -> split -> (a, b)
+                src1 = f.create_node(Source)
+                src2 = f.create_node(Source)
+                split = f.create_node(self.Split)
+                a = f.create_node(Add)
+                b = f.create_node(Add)
+                f.connect_nodes(src1.outputs[0], split.inputs[0], silent=True)
+                f.connect_nodes(src2.outputs[0], split.inputs[1], silent=True)
+                f.connect_nodes(split.outputs[0], a.inputs[0], silent=True)
+                f.connect_nodes(split.outputs[1], b.inputs[0], silent=True)
+
+                src1.val = 1
+                src1.update()
+                self.assertEqual(a.outputs[0].val.payload, 1)
+                self.assertEqual((a.num_updates, b.num_updates), (1, 0))
+                self.assertNotIn(b, f.executor.plan_cache.get(src1).nodes)
+
+                src2.val = 2
+                src2.update()
+                self.assertEqual(b.outputs[0].val.payload, 2)
+                self.assertEqual((a.num_updates, b.num_updates), (1, 1))
+
+                # the analysis of the split node depends on the updated input
+                split.update(inp=1)
+                self.assertEqual((a.num_updates, b.num_updates), (1, 2))
+                self.assertIn((split, 1), f.executor.plan_cache)
+                split.update()
+                self.assertEqual((a.num_updates, b.num_updates), (2, 3))
+
+
+class FlowUpdateMany(unittest.TestCase):
+    """combined executions activate every edge at most once"""
+
+    def runTest(self):
+        for mode in ['data opt', 'data sched', 'data parallel', 'data async']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Source, Add])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode)
+
+                # src1 -> mid -> sink <- src2
+                src1 = f.create_node(Source)
+                src2 = f.create_node(Source)
+                mid = f.create_node(Add)
+                sink = f.create_node(Add)
+                f.connect_nodes(src1.outputs[0], mid.inputs[0], silent=True)
+                f.connect_nodes(mid.outputs[0], sink.inputs[0], silent=True)
+                f.connect_nodes(src2.outputs[0], sink.inputs[1], silent=True)
+
+                src1.val, src2.val = 1, 2
+                f.update_many([src1, src2])
+                self.assertEqual(sink.outputs[0].val.payload, 3)
+                self.assertEqual(mid.num_updates, 1)
+                self.assertEqual(sink.num_updates, 2)
+
+                # a root which is also reachable from another one,
+                # and an output as root
+                mid.num_updates = sink.num_updates = 0
+                src2.outputs[0].val = rc.Data(10)
+                f.update_many([src1, mid, src2.outputs[0]])
+                self.assertEqual(sink.outputs[0].val.payload, 11)
+                self.assertEqual(mid.num_updates, 1)
+                self.assertEqual(sink.num_updates, 2)
+
+                # the downstream root is updated once, after its predecessor,
+                # regardless of the order of the roots
+                mid.num_updates = sink.num_updates = 0
+                src1.val = 5
+                f.update_many([mid, src1])
+                self.assertEqual(mid.outputs[0].val.payload, 5)
+                self.assertEqual(mid.num_updates, 1)
+                self.assertEqual(sink.num_updates, 1)
+
+                # the combined plan is cached
+                self.assertIn((src1, mid, src2.outputs[0]), f.executor.plan_cache)
+
+
+class DataFlowPriorities(unittest.TestCase):
+    """higher priorities go first, low priorities can be deferred"""
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Add])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data opt', defer_below=0)
+
+        src = f.create_node(Source)
+        a, b, log, ctrl, preview = [f.create_node(Add) for _ in range(5)]
+        log.priority = -1
+        ctrl.priority = 10
+        for n in (a, b, log):
+            f.connect_nodes(src.outputs[0], n.inputs[0], silent=True)
+        f.connect_nodes(a.outputs[0], ctrl.inputs[0], silent=True)
+        f.connect_nodes(b.outputs[0], preview.inputs[0], silent=True)
+
+        # the path to ctrl inherits its priority
+        priorities = f.node_priorities()
+        self.assertEqual([priorities[n] for n in (src, a, b, log)], [10, 10, 0, -1])
+
+        # and loses it when the connection is removed
+        f.disconnect_nodes(a.outputs[0], ctrl.inputs[0], silent=True)
+        priorities = f.node_priorities()
+        self.assertEqual([priorities[n] for n in (src, a, b, log)], [0, 0, 0, -1])
+        f.connect_nodes(a.outputs[0], ctrl.inputs[0], silent=True)
+        self.assertEqual([priorities[n] for n in (src, a, b, log)], [10, 10, 0, -1])
+
+        order = []
+        for n in (a, b, log, ctrl, preview):
+            n.updating.sub(lambda inp, n=n: order.append(n))
+
+        src.val = 1
+        src.update()
+        self.assertEqual(order, [a, b, ctrl, preview])
+
+        # the logging node only runs when the deferred updates are run
+        self.assertEqual(log.num_updates, 0)
+        self.assertTrue(f.run_deferred())
+        self.assertEqual(log.num_updates, 1)
+        self.assertEqual(log.outputs[0].val.payload, 1)
+        self.assertFalse(f.run_deferred())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(1))
+
+
+class Waiting(rc.Node):
+    """an async node which tracks how many of its kind run at the same time"""
+
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    running = 0
+    max_running = 0
+
+    async def update_event(self, inp=-1):
+        Waiting.running += 1
+        Waiting.max_running = max(Waiting.max_running, Waiting.running)
+        await asyncio.sleep(0.01)
+        Waiting.running -= 1
+        self.set_output_val(0, rc.Data(self.input(0).payload + 1))
+
+
+class Failing(rc.Node):
+    init_inputs = [rc.NodeInputType()]
+
+    async def update_event(self, inp=-1):
+        await asyncio.sleep(0)
+        raise ValueError('failed')
+
+
+class Sum(rc.Node):
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType(), rc.NodeInputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.result = None
+
+    def update_event(self, inp=-1):
+        self.result = sum(self.input(i).payload for i in range(3))
+
+
+def build(max_concurrency=None):
+    s = rc.Session()
+    s.register_node_types([Source, Waiting, Failing, Sum])
+    f = s.create_flow('main')
+    f.set_algorithm_mode('data async', max_concurrency=max_concurrency)
+
+    src = f.create_node(Source)
+    sink = f.create_node(Sum)
+    for i in range(3):
+        w = f.create_node(Waiting)
+        f.connect_nodes(src.outputs[0], w.inputs[0], silent=True)
+        f.connect_nodes(w.outputs[0], sink.inputs[i], silent=True)
+    failing = f.create_node(Failing)
+    f.connect_nodes(src.outputs[0], failing.inputs[0], silent=True)
+
+    return f, src, sink, failing
+
+
+class DataFlowAsyncBasic(unittest.TestCase):
+
+    def runTest(self):
+        for max_concurrency, expected in [(None, 3), (2, 2), (1, 1)]:
+            with self.subTest(max_concurrency=max_concurrency):
+                f, src, sink, failing = build(max_concurrency)
+                errors = []
+                failing.update_error.sub(lambda e: errors.append(e))
+                Waiting.max_running = 0
+
+                asyncio.run(src.update_async())
+
+                self.assertEqual(sink.result, 6)
+                self.assertEqual(Waiting.max_running, expected)
+                self.assertEqual(len(errors), 1)
+
+
+class DataFlowAsyncEntryPoints(unittest.TestCase):
+
+    def runTest(self):
+        f, src, sink, failing = build()
+
+        # without a running loop, update() runs the execution to completion
+        src.update()
+        self.assertEqual(sink.result, 6)
+
+        async def main():
+            # inside a running loop, update() schedules the execution
+            sink.result = None
+            src.update()
+            self.assertIsNone(sink.result)
+            await asyncio.sleep(0.1)
+            self.assertEqual(sink.result, 6)
+
+            # run_async() updates the sources
+            sink.result = None
+            await f.run_async()
+            self.assertEqual(sink.result, 6)
+
+        asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        pass
+
+
+class Add(rc.Node):
+    """adds both inputs for every item"""
+
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.input(0).payload + self.input(1).payload))
+
+
+class Double(rc.Node):
+    """doubles whole batches at once"""
+
+    batch_format = 'list'
+
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data([2 * v for v in self.input(0).payload]))
+
+
+class FlowRunBatch(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Add, Double])
+        f = s.create_flow('main')
+
+        src = f.create_node(Source)
+        double = f.create_node(Double)
+        add = f.create_node(Add)
+        f.connect_nodes(src.outputs[0], double.inputs[0], silent=True)
+        f.connect_nodes(double.outputs[0], add.inputs[0], silent=True)
+        f.connect_nodes(src.outputs[0], add.inputs[1], silent=True)
+
+        executor = f.executor
+        results = f.run_batch(
+            {src.outputs[0]: [rc.Data(i) for i in range(5)]},
+            outputs=[double.outputs[0], add.outputs[0]],
+        )
+
+        self.assertEqual([d.payload for d in results[double.outputs[0]]], [0, 2, 4, 6, 8])
+        self.assertEqual([d.payload for d in results[add.outputs[0]]], [0, 3, 6, 9, 12])
+
+        # the batched node ran once, the other one per item, and once per input
+        self.assertEqual(double.num_updates, 1)
+        self.assertEqual(add.num_updates, 2 * 5)
+
+        # the outputs hold the last item, and the flow's executor is restored
+        self.assertEqual(add.outputs[0].val.payload, 12)
+        self.assertIs(f.executor, executor)
+
+        # batched nodes must produce one value per item
+        double.update_event = lambda inp=-1: double.set_output_val(0, rc.Data([]))
+        errors = []
+        double.update_err = errors.append
+        f.run_batch({src.outputs[0]: [rc.Data(1), rc.Data(2)]})
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.val = 0
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(self.val))
+
+
+class Newton(rc.Node):
+    """one Newton step for the square root of the first input,
+    starting from the second input (the feedback)"""
+
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        a = self.input(0).payload
+        x = self.input(1).payload if self.input(1) is not None else a
+        self.set_output_val(0, rc.Data(round((x + a / x) / 2, 9)))
+
+
+class Forward(rc.Node):
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, self.input(0))
+
+
+def build_loop(**options):
+    """src -> newton <-> forward, forward -> sink"""
+
+    s = rc.Session()
+    s.register_node_types([Source, Newton, Forward])
+    f = s.create_flow('main')
+    f.set_algorithm_mode('data cyclic', **options)
+
+    src = f.create_node(Source)
+    newton = f.create_node(Newton)
+    fwd = f.create_node(Forward)
+    sink = f.create_node(Forward)
+    f.connect_nodes(src.outputs[0], newton.inputs[0], silent=True)
+    f.connect_nodes(newton.outputs[0], fwd.inputs[0], silent=True)
+    f.connect_nodes(fwd.outputs[0], newton.inputs[1], silent=True)
+    f.connect_nodes(fwd.outputs[0], sink.inputs[0], silent=True)
+    return f, src, newton, sink
+
+
+class DataFlowFixedPointLoop(unittest.TestCase):
+
+    def runTest(self):
+        f, src, newton, sink = build_loop()
+
+        src.val = 2
+        src.update()
+
+        # the loop converged, and its successor received the final value once
+        self.assertAlmostEqual(sink.outputs[0].val.payload, 2 ** 0.5)
+        self.assertGreater(newton.num_updates, 2)
+        self.assertEqual(sink.num_updates, 1)
+
+        # the components are cached per root
+        self.assertIn(src, f.executor.plan_cache)
+        self.assertEqual(
+            [len(c) for c in f.executor.plan_cache.get(src).components], [1, 2, 1])
+
+
+class DataFlowFixedPointLimit(unittest.TestCase):
+
+    def runTest(self):
+        # a convergence test that never holds hits the iteration limit
+        f, src, newton, sink = build_loop(max_iterations=5, converged=lambda old, new: False)
+
+        errors = []
+        newton.update_err = errors.append
+
+        src.val = 2
+        src.update()
+
+        self.assertEqual(newton.num_updates, 5)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], RuntimeError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.val = 0
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.val))
+
+
+class Add(rc.Node):
+    """adds both inputs; counts update events"""
+
+    init_inputs = [
+        rc.NodeInputType(default=rc.Data(0)),
+        rc.NodeInputType(default=rc.Data(0)),
+    ]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.input(0).payload + self.input(1).payload))
+
+
+class DataFlowLazyPull(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Add])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data lazy')
+
+        # src -> (a, b) -> c, and an unobserved preview of src
+        src = f.create_node(Source)
+        a = f.create_node(Add)
+        b = f.create_node(Add)
+        c = f.create_node(Add)
+        preview = f.create_node(Add)
+        f.connect_nodes(src.outputs[0], a.inputs[0], silent=True)
+        f.connect_nodes(src.outputs[0], b.inputs[0], silent=True)
+        f.connect_nodes(a.outputs[0], c.inputs[0], silent=True)
+        f.connect_nodes(b.outputs[0], c.inputs[1], silent=True)
+        f.connect_nodes(src.outputs[0], preview.inputs[0], silent=True)
+
+        # updates only mark the nodes
+        src.val = 1
+        src.update()
+        self.assertEqual(src.num_updates, 0)
+        self.assertIsNone(c.outputs[0].val)
+
+        # reading pulls through the ancestors, once each
+        self.assertEqual(f.get(c.outputs[0]).payload, 2)
+        self.assertEqual([n.num_updates for n in (src, a, b, c)], [1, 1, 1, 2])
+        self.assertEqual(preview.num_updates, 0)
+
+        # clean values are not recomputed
+        self.assertEqual(f.get(c.outputs[0]).payload, 2)
+        self.assertEqual(c.num_updates, 2)
+
+        # setting an output marks its successors, and inputs pull as well
+        src.set_output_val(0, rc.Data(5))
+        self.assertEqual(a.num_updates, 1)
+        self.assertEqual(c.input(1).payload, 5)
+        self.assertEqual(b.num_updates, 2)
+        self.assertEqual(a.num_updates, 1)
+        self.assertEqual(f.get(c.outputs[0]).payload, 10)
+        self.assertEqual(src.num_updates, 1)
+        self.assertEqual(preview.num_updates, 0)
+
+        # only observed when read
+        self.assertEqual(f.get(preview.outputs[0]).payload, 5)
+        self.assertEqual(preview.num_updates, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
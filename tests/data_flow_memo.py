@@ -0,0 +1,128 @@
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.val = 0
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(self.val))
+
+
+class Scale(rc.Node):
+    """multiplies the input by a factor stored in the state"""
+
+    pure = True
+
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.factor = 2
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.input(0).payload * self.factor))
+
+    def get_state(self):
+        return {'factor': self.factor}
+
+
+class DataFlowMemoization(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Scale])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data memo', memo_cache_size=4)
+
+        src = f.create_node(Source)
+        a = f.create_node(Scale)
+        b = f.create_node(Scale)
+        f.connect_nodes(src.outputs[0], a.inputs[0], silent=True)
+        f.connect_nodes(a.outputs[0], b.inputs[0], silent=True)
+
+        src.val = 1
+        src.update()
+        self.assertEqual(b.outputs[0].val.payload, 4)
+        self.assertEqual((a.num_updates, b.num_updates), (1, 1))
+
+        # unchanged inputs reuse the cached outputs
+        src.update()
+        self.assertEqual(b.outputs[0].val.payload, 4)
+        self.assertEqual((a.num_updates, b.num_updates), (1, 1))
+
+        # new inputs are computed, old ones are still cached
+        src.val = 2
+        src.update()
+        src.val = 1
+        src.update()
+        self.assertEqual(b.outputs[0].val.payload, 4)
+        self.assertEqual((a.num_updates, b.num_updates), (2, 2))
+
+        # the state is part of the key
+        a.factor = 3
+        src.update()
+        self.assertEqual(b.outputs[0].val.payload, 6)
+        self.assertEqual((a.num_updates, b.num_updates), (3, 3))
+
+        # the least recently used entries are evicted
+        self.assertEqual(len(f.executor.memo_cache), 4)
+
+        # graph changes at a node invalidate its entries
+        f.connect_nodes(b.outputs[0], f.create_node(Scale).inputs[0], silent=True)
+        src.update()
+        self.assertEqual((a.num_updates, b.num_updates), (3, 4))
+
+
+class DataFlowDuplicateElimination(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Scale])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data memo', memo_cache_size=0, eliminate_duplicates=True)
+
+        # two identical chains src -> a_i -> b_i
+        src = f.create_node(Source)
+        a = [f.create_node(Scale) for _ in range(2)]
+        b = [f.create_node(Scale) for _ in range(2)]
+        for i in range(2):
+            f.connect_nodes(src.outputs[0], a[i].inputs[0], silent=True)
+            f.connect_nodes(a[i].outputs[0], b[i].inputs[0], silent=True)
+        self.assertEqual(f.duplicate_nodes(), {a[1]: a[0], b[1]: b[0]})
+
+        src.val = 1
+        src.update()
+        self.assertEqual(b[1].outputs[0].val.payload, 4)
+        # whichever duplicate comes first is updated
+        num_updates = lambda nodes: sum(n.num_updates for n in nodes)
+        self.assertEqual((num_updates(a), num_updates(b)), (1, 1))
+        self.assertIs(a[0].outputs[0].val, a[1].outputs[0].val)
+        self.assertIs(b[0].outputs[0].val, b[1].outputs[0].val)
+
+        # without the memo cache, the next execution computes again
+        src.update()
+        self.assertEqual((num_updates(a), num_updates(b)), (2, 2))
+
+        # different states are not shared, which also separates the successors
+        a[1].factor = 3
+        src.update()
+        self.assertEqual(b[1].outputs[0].val.payload, 6)
+        self.assertEqual((num_updates(a), num_updates(b)), (4, 4))
+
+        # the duplicates are found again after graph changes
+        f.disconnect_nodes(a[1].outputs[0], b[1].inputs[0], silent=True)
+        self.assertEqual(f.duplicate_nodes(), {a[1]: a[0]})
+
+
+if __name__ == '__main__':
+    unittest.main()
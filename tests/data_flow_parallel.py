@@ -0,0 +1,85 @@
+import threading
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(1))
+
+
+class Worker(rc.Node):
+    """waits until all workers run at the same time"""
+
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    barrier: threading.Barrier
+
+    def update_event(self, inp=-1):
+        self.barrier.wait(timeout=5)
+        self.set_output_val(0, rc.Data(self.input(0).payload + 1))
+
+
+class Failing(rc.Node):
+    init_inputs = [rc.NodeInputType()]
+
+    def update_event(self, inp=-1):
+        raise ValueError('failed')
+
+
+class Sum(rc.Node):
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType(), rc.NodeInputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.result = None
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.result = sum(self.input(i).payload for i in range(3))
+
+
+class DataFlowParallelBasic(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Worker, Failing, Sum])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data parallel', max_workers=3)
+
+        src = f.create_node(Source)
+        workers = [f.create_node(Worker) for _ in range(3)]
+        failing = f.create_node(Failing)
+        sink = f.create_node(Sum)
+        for i, w in enumerate(workers):
+            f.connect_nodes(src.outputs[0], w.inputs[0], silent=True)
+            f.connect_nodes(w.outputs[0], sink.inputs[i], silent=True)
+        f.connect_nodes(src.outputs[0], failing.inputs[0], silent=True)
+
+        # the three workers only finish if they run concurrently
+        Worker.barrier = threading.Barrier(3)
+
+        event_threads = []
+        errors = []
+        for n in f.nodes:
+            n.updating.sub(lambda inp: event_threads.append(threading.get_ident()))
+        failing.update_error.sub(lambda e: errors.append(e))
+
+        src.update()
+
+        self.assertEqual(sink.result, 6)
+        self.assertEqual(sink.num_updates, 3)
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertEqual(set(event_threads), {threading.get_ident()})
+
+        f.executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(21))
+
+
+class Double(rc.Node):
+    """runs in a worker process and counts its calls there"""
+
+    run_in_process = True
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType(), rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.factor = 2
+        self.calls = 0
+
+    def get_state(self):
+        return {'factor': self.factor}
+
+    def set_state(self, data, version):
+        self.factor = data['factor']
+
+    def update_event(self, inp=-1):
+        self.calls += 1
+        self.set_output_val(0, rc.Data(self.input(0).payload * self.factor))
+        self.set_output_val(1, rc.Data((os.getpid(), self.calls)))
+
+
+class Failing(rc.Node):
+    run_in_process = True
+    init_inputs = [rc.NodeInputType()]
+
+    def update_event(self, inp=-1):
+        raise ValueError('failed')
+
+
+class Sink(rc.Node):
+    init_inputs = [rc.NodeInputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.result = None
+
+    def update_event(self, inp=-1):
+        self.result = self.input(0).payload
+
+
+class DataFlowMultiProcessBasic(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Double, Failing, Sink])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data process', max_processes=1)
+
+        src = f.create_node(Source)
+        double = f.create_node(Double)
+        failing = f.create_node(Failing)
+        sink = f.create_node(Sink)
+        f.connect_nodes(src.outputs[0], double.inputs[0], silent=True)
+        f.connect_nodes(src.outputs[0], failing.inputs[0], silent=True)
+        f.connect_nodes(double.outputs[0], sink.inputs[0], silent=True)
+
+        errors = []
+        failing.update_error.sub(lambda e: errors.append(e))
+
+        try:
+            src.update()
+            self.assertEqual(sink.result, 42)
+            pid, calls = double.outputs[1].val.payload
+            self.assertNotEqual(pid, os.getpid())
+            self.assertEqual(calls, 1)
+            self.assertEqual(len(errors), 1)
+            self.assertIsInstance(errors[0], ValueError)
+
+            # the worker keeps the node between executions
+            src.update()
+            self.assertEqual(double.outputs[1].val.payload, (pid, 2))
+
+            # and rebuilds it when its state changed
+            double.factor = 3
+            src.update()
+            self.assertEqual(sink.result, 63)
+            self.assertEqual(double.outputs[1].val.payload, (pid, 1))
+
+            # the node itself never ran in the main process
+            self.assertEqual(double.calls, 0)
+        finally:
+            f.executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.val = 0
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(self.val))
+
+
+class Add(rc.Node):
+    """adds both inputs; counts update events"""
+
+    init_inputs = [
+        rc.NodeInputType(default=rc.Data(0)),
+        rc.NodeInputType(default=rc.Data(0)),
+    ]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        self.set_output_val(0, rc.Data(self.input(0).payload + self.input(1).payload))
+
+
+class DataFlowSlices(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Add])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data sliced')
+
+        # a chain of diamonds
+        src = f.create_node(Source)
+        last = src
+        for _ in range(4):
+            a, b, c = [f.create_node(Add) for _ in range(3)]
+            f.connect_nodes(last.outputs[0], a.inputs[0], silent=True)
+            f.connect_nodes(last.outputs[0], b.inputs[0], silent=True)
+            f.connect_nodes(a.outputs[0], c.inputs[0], silent=True)
+            f.connect_nodes(b.outputs[0], c.inputs[1], silent=True)
+            last = c
+
+        # updates are only queued
+        src.val = 1
+        src.update()
+        self.assertEqual(last.num_updates, 0)
+
+        # a zero budget runs one unit of work per slice
+        slices = 1
+        while f.run_slice(0):
+            slices += 1
+            if slices == 3:
+                # queued while the first execution is suspended
+                src.val = 2
+                src.update()
+        self.assertGreater(slices, 10)
+        self.assertEqual(last.outputs[0].val.payload, 32)
+        # every connection is activated at most once per execution
+        self.assertEqual(last.num_updates, 4)
+
+        # a large budget finishes everything at once
+        src.val = 3
+        src.update()
+        self.assertFalse(f.run_slice(10))
+        self.assertEqual(last.outputs[0].val.payload, 48)
+
+        # other modes don't queue anything
+        f.set_algorithm_mode('data opt')
+        self.assertFalse(f.run_slice())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+import ryvencore as rc
+
+
+class Generator(rc.Node):
+    """emits a stream of ``count`` items in a single update"""
+
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.count = 0
+        self.emitted = 0
+
+    def update_event(self, inp=-1):
+        for i in range(self.count):
+            self.emitted += 1
+            self.set_output_val(0, rc.Data(i))
+
+
+class Stage(rc.Node):
+    """adds one to every item, optionally slowly"""
+
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.delay = 0
+        self.received = []
+        self.threads = set()
+
+    def update_event(self, inp=-1):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        val = self.input(0).payload
+        self.received.append(val)
+        self.set_output_val(0, rc.Data(val + 1))
+
+
+class DataFlowStreamPipeline(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Generator, Stage])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data stream', queue_size=2)
+
+        gen = f.create_node(Generator)
+        a = f.create_node(Stage)
+        b = f.create_node(Stage)
+        f.connect_nodes(gen.outputs[0], a.inputs[0], silent=True)
+        f.connect_nodes(a.outputs[0], b.inputs[0], silent=True)
+
+        # a slow consumer throttles the producer
+        b.delay = 0.005
+        backlog = []
+        a.updating.sub(lambda inp: backlog.append(gen.emitted - len(b.received)))
+
+        gen.count = 20
+        gen.update()
+
+        # all items pass all stages in order
+        self.assertEqual(a.received, list(range(20)))
+        self.assertEqual(b.received, list(range(1, 21)))
+        self.assertEqual(b.outputs[0].val.payload, 21)
+
+        # the stages ran in their own threads
+        self.assertNotIn(threading.get_ident(), a.threads | b.threads)
+        self.assertNotEqual(a.threads, b.threads)
+
+        # items pending anywhere in the pipeline are bounded by the queues
+        # (2 per connection, plus one item being processed in every stage)
+        self.assertLessEqual(max(backlog), 2 * 2 + 2 + 1)
+
+
+class DataFlowStreamErrors(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Generator, Stage])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data stream')
+
+        gen = f.create_node(Generator)
+        a = f.create_node(Stage)
+        b = f.create_node(Stage)
+        f.connect_nodes(gen.outputs[0], a.inputs[0], silent=True)
+        f.connect_nodes(a.outputs[0], b.inputs[0], silent=True)
+
+        # failing items are reported, and the stream goes on
+        def update_event(inp=-1):
+            val = a.input(0).payload
+            if val % 2 == 1:
+                raise ValueError(val)
+            a.set_output_val(0, rc.Data(val))
+        a.update_event = update_event
+        errors = []
+        a.update_err = errors.append
+
+        gen.count = 6
+        gen.update()
+
+        self.assertEqual([e.args[0] for e in errors], [1, 3, 5])
+        self.assertEqual(b.received, [0, 2, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,273 @@
+import sys
+import unittest
+import ryvencore as rc
+
+
+DEPTH = 2 * sys.getrecursionlimit()
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(0))
+
+
+class Inc(rc.Node):
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(self.input(0).payload + 1))
+
+
+class IncTwice(rc.Node):
+    """passes the incremented input on, and sets a second output"""
+
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType(), rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        val = self.input(0).payload + 1
+        self.set_output_val(0, rc.Data(val))
+        self.set_output_val(1, rc.Data(-val))
+
+
+class DataFlowDeepChain(unittest.TestCase):
+    """propagation through chains deeper than the recursion limit"""
+
+    def runTest(self):
+        for mode in ['data', 'data opt']:
+            with self.subTest(mode=mode):
+                s = rc.Session()
+                s.register_node_types([Source, Inc, IncTwice])
+                f = s.create_flow('main')
+                f.set_algorithm_mode(mode)
+
+                src = f.create_node(Source)
+                last = src
+                for _ in range(DEPTH):
+                    n = f.create_node(Inc)
+                    f.connect_nodes(last.outputs[0], n.inputs[0], silent=True)
+                    last = n
+
+                src.update()
+                self.assertEqual(last.outputs[0].val.payload, DEPTH)
+
+                # nodes which set several outputs
+                last = src
+                for _ in range(DEPTH):
+                    n = f.create_node(IncTwice)
+                    f.connect_nodes(last.outputs[0], n.inputs[0], silent=True)
+                    side = f.create_node(Inc)
+                    f.connect_nodes(n.outputs[1], side.inputs[0], silent=True)
+                    last = n
+
+                src.update()
+                self.assertEqual(last.outputs[0].val.payload, DEPTH)
+                self.assertEqual(last.outputs[1].val.payload, -DEPTH)
+
+
+class ExecStep(rc.Node):
+    """pulls its data input and triggers its exec output"""
+
+    init_inputs = [rc.NodeInputType(type_='exec'), rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType(type_='exec'), rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        d = self.input(1)
+        self.set_output_val(1, rc.Data(d.payload + 1 if d is not None else 0))
+        if inp == 0:
+            self.exec_output(0)
+
+
+class ExecLoop(rc.Node):
+    """triggers its exec output until the shared counter reaches the depth"""
+
+    init_inputs = [rc.NodeInputType(type_='exec')]
+    init_outputs = [rc.NodeOutputType(type_='exec')]
+
+    counter = [0]
+
+    def update_event(self, inp=-1):
+        self.counter[0] += 1
+        if self.counter[0] < DEPTH:
+            self.exec_output(0)
+
+
+class ExecSequence(rc.Node):
+    """executes both exec outputs, one after another"""
+
+    init_inputs = [rc.NodeInputType(type_='exec')]
+    init_outputs = [rc.NodeOutputType(type_='exec'), rc.NodeOutputType(type_='exec')]
+
+    num_updates = [0]
+
+    def update_event(self, inp=-1):
+        self.num_updates[0] += 1
+        self.exec_output(0)
+        self.exec_output(1)
+
+
+class ExecFlowDeep(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([ExecStep, ExecLoop, ExecSequence])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('exec')
+
+        # a long exec chain, and a long data chain pulled by the end
+        first = f.create_node(ExecStep)
+        last = first
+        for _ in range(DEPTH):
+            n = f.create_node(ExecStep)
+            f.connect_nodes(last.outputs[0], n.inputs[0], silent=True)
+            last = n
+
+        data_first = f.create_node(ExecStep)
+        data_last = data_first
+        for _ in range(DEPTH):
+            n = f.create_node(ExecStep)
+            f.connect_nodes(data_last.outputs[1], n.inputs[1], silent=True)
+            data_last = n
+        f.connect_nodes(data_last.outputs[1], last.inputs[1], silent=True)
+
+        first.update(0)
+        self.assertEqual(last.outputs[1].val.payload, DEPTH + 1)
+
+        # an exec loop which re-triggers itself
+        a = f.create_node(ExecLoop)
+        b = f.create_node(ExecLoop)
+        f.connect_nodes(a.outputs[0], b.inputs[0], silent=True)
+        f.connect_nodes(b.outputs[0], a.inputs[0], silent=True)
+        a.update(0)
+        self.assertEqual(ExecLoop.counter[0], DEPTH)
+
+        # a long chain of sequence nodes, which also execute a leaf each
+        first = f.create_node(ExecSequence)
+        last = first
+        for _ in range(DEPTH):
+            leaf = f.create_node(ExecSequence)
+            f.connect_nodes(last.outputs[1], leaf.inputs[0], silent=True)
+            n = f.create_node(ExecSequence)
+            f.connect_nodes(last.outputs[0], n.inputs[0], silent=True)
+            last = n
+        first.update(0)
+        self.assertEqual(ExecSequence.num_updates[0], 2 * DEPTH + 1)
+
+
+class Logged(rc.Node):
+    """logs its update events before reading its inputs"""
+
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    log = []
+
+    def update_event(self, inp=-1):
+        self.log.append(self.title)
+        self.set_output_val(0, rc.Data(self.title))
+
+
+class Select(Logged):
+    """only reads its first input"""
+
+    title = 'select'
+
+    def update_event(self, inp=-1):
+        self.log.append(self.title)
+        self.set_output_val(0, self.input(0))
+
+
+class Cheap(Logged):
+    title = 'cheap'
+
+
+class Expensive(Logged):
+    title = 'expensive'
+
+
+class Display(Logged):
+    title = 'display'
+
+    def update_event(self, inp=-1):
+        self.log.append(self.title)
+        self.input(0)
+
+
+class ExecFlowPull(unittest.TestCase):
+    """data requests only update the nodes whose data is requested"""
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Select, Cheap, Expensive, Display])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('exec')
+
+        select = f.create_node(Select)
+        cheap = f.create_node(Cheap)
+        expensive = f.create_node(Expensive)
+        f.connect_nodes(cheap.outputs[0], select.inputs[0], silent=True)
+        f.connect_nodes(expensive.outputs[0], select.inputs[1], silent=True)
+        display = f.create_node(Display)
+        f.connect_nodes(select.outputs[0], display.inputs[0], silent=True)
+
+        display.update()
+        self.assertEqual(Logged.log, ['display', 'select', 'cheap'])
+        self.assertEqual(select.outputs[0].val.payload, 'cheap')
+
+
+class Emitter(rc.Node):
+    """sets its data output three times, then executes its exec output for each item"""
+
+    init_inputs = [rc.NodeInputType(type_='exec')]
+    init_outputs = [rc.NodeOutputType(), rc.NodeOutputType(type_='exec'), rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        for i in range(3):
+            self.set_output_val(0, rc.Data(i))
+        for i in range(3):
+            self.set_output_val(2, rc.Data(i))
+            self.exec_output(1)
+
+
+class Recorder(rc.Node):
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType(type_='exec')]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.vals = []
+
+    def update_event(self, inp=-1):
+        self.vals.append(self.input(0).payload)
+
+
+class MultipleEmits(unittest.TestCase):
+    """successors see every value an update event sets, in order"""
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Emitter, Recorder])
+
+        f = s.create_flow('data')
+        emitter = f.create_node(Emitter)
+        recorder = f.create_node(Recorder)
+        f.connect_nodes(emitter.outputs[0], recorder.inputs[0], silent=True)
+        emitter.update()
+        self.assertEqual(recorder.vals, [0, 1, 2])
+
+        # a for-each node in exec mode
+        f = s.create_flow('exec')
+        f.set_algorithm_mode('exec')
+        emitter = f.create_node(Emitter)
+        body = f.create_node(Recorder)
+        f.connect_nodes(emitter.outputs[2], body.inputs[0], silent=True)
+        f.connect_nodes(emitter.outputs[1], body.inputs[1], silent=True)
+        emitter.update(0)
+        self.assertEqual(body.vals, [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
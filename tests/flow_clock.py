@@ -0,0 +1,107 @@
+import time
+import unittest
+import ryvencore as rc
+
+
+class Ticker(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    interval = 1.0
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.ticks = 0
+
+    def place_event(self):
+        self.flow.clock.register(self, self.interval)
+
+    def remove_event(self):
+        self.flow.clock.unregister(self)
+
+    def update_event(self, inp=-1):
+        self.ticks += 1
+        self.set_output_val(0, rc.Data(self.ticks))
+
+
+class FastTicker(Ticker):
+    interval = 0.5
+
+
+class Join(rc.Node):
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+
+
+class FlowClock(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Ticker, FastTicker, Join])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data opt')
+
+        now = [0.0]
+        f.clock.time_func = lambda: now[0]
+
+        slow = f.create_node(Ticker)
+        fast = f.create_node(FastTicker)
+        join = f.create_node(Join)
+        f.connect_nodes(slow.outputs[0], join.inputs[0], silent=True)
+        f.connect_nodes(fast.outputs[0], join.inputs[1], silent=True)
+        self.assertEqual(f.clock.next_due(), 0.5)
+
+        now[0] = 0.5
+        self.assertEqual(f.clock.tick(), [fast])
+        self.assertEqual(join.num_updates, 1)
+
+        # due nodes are updated in one combined execution
+        now[0] = 1.0
+        self.assertEqual(set(f.clock.tick()), {slow, fast})
+        self.assertEqual(join.num_updates, 3)
+        self.assertEqual(f.clock.stats.overruns, 0)
+
+        # a late tick counts the jitter and the skipped periods
+        now[0] = 2.1
+        f.clock.tick()
+        self.assertEqual((slow.ticks, fast.ticks), (2, 3))
+        self.assertEqual(f.clock.stats.overruns, 1)
+        self.assertAlmostEqual(f.clock.stats.max_jitter, 0.6)
+        self.assertEqual(f.clock.next_due(), 2.5)
+
+        f.remove_node(fast)
+        self.assertEqual(f.clock.next_due(), 3.0)
+
+
+class FlowClockThread(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([FastTicker])
+        f = s.create_flow('main')
+
+        FastTicker.interval = 0.01
+        try:
+            ticker = f.create_node(FastTicker)
+        finally:
+            FastTicker.interval = 0.5
+
+        f.clock.start()
+        time.sleep(0.2)
+        f.clock.stop()
+        ticks = ticker.ticks
+        self.assertGreater(ticks, 0)
+
+        time.sleep(0.05)
+        self.assertEqual(ticker.ticks, ticks)
+
+
+if __name__ == '__main__':
+    unittest.main()
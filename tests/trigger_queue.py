@@ -0,0 +1,193 @@
+import threading
+import unittest
+from concurrent.futures import CancelledError
+import ryvencore as rc
+
+
+class Source(rc.Node):
+    init_outputs = [rc.NodeOutputType()]
+
+    def update_event(self, inp=-1):
+        self.set_output_val(0, rc.Data(1))
+
+
+class Counter(rc.Node):
+    init_inputs = [rc.NodeInputType(), rc.NodeInputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.num_updates = 0
+        self.vals = []
+
+    def update_event(self, inp=-1):
+        self.num_updates += 1
+        if inp != -1:
+            self.vals.append(self.input(inp).payload)
+
+
+class TriggerQueueDispatch(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Counter])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data opt')
+
+        src1 = f.create_node(Source)
+        src2 = f.create_node(Source)
+        counter = f.create_node(Counter)
+        f.connect_nodes(src1.outputs[0], counter.inputs[0], silent=True)
+        f.connect_nodes(src2.outputs[0], counter.inputs[1], silent=True)
+
+        # duplicates are coalesced
+        futures = [f.triggers.update(src1) for _ in range(3)] + [f.triggers.update(src2)]
+        self.assertIs(futures[0], futures[2])
+        self.assertEqual(len(f.triggers), 2)
+        self.assertFalse(futures[0].done())
+
+        self.assertEqual(f.triggers.dispatch(), 2)
+        self.assertTrue(all(fut.done() for fut in futures))
+        # both sources ran in one combined execution
+        self.assertEqual(counter.num_updates, 2)
+
+        # the most recent output value wins, cancelled triggers are dropped
+        for val in range(5):
+            f.triggers.set_output_val(src1, 0, rc.Data(val))
+        f.triggers.update(counter).cancel()
+        f.triggers.dispatch()
+        self.assertEqual(counter.vals, [1, 1, 4])
+        self.assertEqual(counter.num_updates, 3)
+
+        # a trigger which is enqueued again after it was cancelled runs
+        cancelled = f.triggers.update(counter)
+        cancelled.cancel()
+        future = f.triggers.update(counter)
+        self.assertIsNot(future, cancelled)
+        f.triggers.dispatch()
+        self.assertIsNone(future.result(timeout=0))
+        self.assertEqual(counter.num_updates, 4)
+
+
+class Slow(rc.Node):
+    """simulates new input arriving while it runs"""
+
+    init_inputs = [rc.NodeInputType()]
+    init_outputs = [rc.NodeOutputType()]
+
+    def __init__(self, params):
+        super().__init__(params)
+
+        self.new_input = None
+        self.cancelled = []
+
+    def update_event(self, inp=-1):
+        if self.new_input is not None:
+            self.flow.triggers.update(self.new_input)
+            self.new_input = None
+        self.cancelled.append(self.flow.cancellation.cancelled)
+        self.set_output_val(0, self.input(0))
+
+
+class TriggerQueueSupersede(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Slow, Counter])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data opt')
+        f.triggers.supersede = True
+
+        src = f.create_node(Source)
+        slow = f.create_node(Slow)
+        counter = f.create_node(Counter)
+        f.connect_nodes(src.outputs[0], slow.inputs[0], silent=True)
+        f.connect_nodes(slow.outputs[0], counter.inputs[0], silent=True)
+
+        # the remaining work of the old execution is skipped
+        slow.new_input = src
+        old = f.triggers.update(src)
+        f.triggers.dispatch()
+        self.assertEqual(slow.cancelled, [True])
+        self.assertEqual(counter.num_updates, 0)
+        with self.assertRaises(CancelledError):
+            old.result()
+        self.assertFalse(f.cancellation.cancelled)
+
+        # and the new one runs completely
+        self.assertEqual(len(f.triggers), 1)
+        f.triggers.dispatch()
+        self.assertEqual(slow.cancelled, [True, False])
+        self.assertEqual(counter.num_updates, 1)
+
+        # triggers for other nodes don't cancel the batch
+        slow.new_input = counter
+        old = f.triggers.update(src)
+        f.triggers.dispatch()
+        self.assertEqual(slow.cancelled[-1], False)
+        self.assertIsNone(old.result(timeout=0))
+        self.assertEqual(counter.num_updates, 2)
+        f.triggers.dispatch()
+        self.assertEqual(counter.num_updates, 3)
+
+        # the triggers of a superseded batch which weren't replaced run again
+        slow.new_input = src
+        f.triggers.update(src)
+        other = f.triggers.update(counter, 0)
+        f.triggers.dispatch()
+        self.assertFalse(other.done())
+        self.assertEqual(counter.num_updates, 3)
+        self.assertEqual(len(f.triggers), 2)
+        f.triggers.dispatch()
+        self.assertIsNone(other.result(timeout=0))
+        self.assertEqual(counter.num_updates, 5)
+
+        # cancelling a batch explicitly fails all its triggers
+        slow.new_input = None
+        slow.update_event = lambda inp=-1: f.triggers.cancel()
+        cancelled = [f.triggers.update(src), f.triggers.update(counter, 0)]
+        f.triggers.dispatch()
+        for future in cancelled:
+            with self.assertRaises(CancelledError):
+                future.result(timeout=0)
+        self.assertEqual(len(f.triggers), 0)
+
+
+class TriggerQueueThreads(unittest.TestCase):
+
+    def runTest(self):
+        s = rc.Session()
+        s.register_node_types([Source, Counter])
+        f = s.create_flow('main')
+        f.set_algorithm_mode('data opt')
+
+        counter = f.create_node(Counter)
+
+        f.triggers.start()
+        try:
+            futures = []
+            lock = threading.Lock()
+
+            def trigger():
+                for _ in range(50):
+                    fut = f.triggers.update(counter)
+                    with lock:
+                        futures.append(fut)
+
+            threads = [threading.Thread(target=trigger) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for fut in futures:
+                fut.result(timeout=5)
+        finally:
+            f.triggers.stop()
+
+        self.assertGreater(counter.num_updates, 0)
+        self.assertLessEqual(counter.num_updates, 200)
+        self.assertEqual(len(f.triggers), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()